@@ -7,34 +7,55 @@ Provides API endpoints to trigger article publishing and monitoring
 import os
 import sys
 import logging
+import mmap
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pytz
-from flask import Flask, jsonify, request, render_template_string
+from typing import Optional
+from zoneinfo import ZoneInfo
+import orjson
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import escape
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv('env.env')
 
 # Import our modules
-from main import NewsPublisher
+from main import get_news_publisher
 from db import DatabaseManager
+from logging_config import setup_logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('cineulagam_publisher.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+LOG_FILE = 'cineulagam_publisher.log'
+setup_logging(LOG_FILE)
 
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson
+    Keys stay sorted and datetimes still go through Flask's default handling
+    """
+    
+    options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Global variables for status tracking
 publisher_status = {
@@ -44,9 +65,34 @@ publisher_status = {
     'articles_published': 0,
     'current_status': 'idle'
 }
+# Guards every read and write of publisher_status
+_status_lock = threading.Lock()
+
+# Pipeline runs execute on one long-lived worker thread instead of a new thread per request
+_publisher_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='publisher')
 
-# Database manager for stats
-db_manager = DatabaseManager()
+# Database manager for stats, connected lazily and retried while the database is down
+_DB_RETRY_INTERVAL = 30.0
+_db_manager = None
+_db_retry_at = 0.0
+
+def _get_db_manager() -> Optional[DatabaseManager]:
+    """Return the shared DatabaseManager, or None while the database is unreachable"""
+    global _db_manager, _db_retry_at
+    if _db_manager is None and time.monotonic() >= _db_retry_at:
+        try:
+            _db_manager = DatabaseManager.get()
+        except RuntimeError as e:
+            logger.error(f"Database not connected: {str(e)}")
+            _db_retry_at = time.monotonic() + _DB_RETRY_INTERVAL
+    return _db_manager
+
+_get_db_manager()
+
+# Short-lived cache of DatabaseManager.get_stats() shared by all dashboard clients
+_STATS_TTL = 15.0
+_stats_cache = {'ts': 0.0, 'val': None}
+_stats_lock = threading.Lock()
 
 # HTML template for the dashboard
 DASHBOARD_TEMPLATE = '''
@@ -152,6 +198,9 @@ DASHBOARD_TEMPLATE = '''
             font-family: 'Courier New', monospace;
             font-size: 14px;
         }
+        #logs {
+            white-space: pre-wrap;
+        }
     </style>
 </head>
 <body>
@@ -261,59 +310,298 @@ DASHBOARD_TEMPLATE = '''
                 .catch(error => console.error('Error:', error));
         }
         
+        // Byte offset of the log file already shown, null until the first fetch
+        let logOffset = null;
+        let logTail = '';
+        
+        function loadLogs() {
+            // Start from the last 64KB, then only ask for bytes appended since
+            const range = logOffset === null ? 'bytes=-65536' : `bytes=${logOffset}-`;
+            fetch('/api/logs/raw', { headers: { 'Range': range } })
+                .then(response => {
+                    const contentRange = response.headers.get('Content-Range');
+                    const total = contentRange ? parseInt(contentRange.split('/')[1], 10) : null;
+                    if (response.status === 404) {
+                        document.getElementById('logs').textContent = 'No log file found';
+                        return;
+                    }
+                    if (response.status === 416) {
+                        if (logOffset === null) {
+                            // Log is smaller than the tail window, read it from the start
+                            logOffset = 0;
+                            loadLogs();
+                        } else if (total !== null && total < logOffset) {
+                            // Log was truncated, re-read the tail
+                            logOffset = null;
+                            logTail = '';
+                        }
+                        return;
+                    }
+                    if (!response.ok) {
+                        return;
+                    }
+                    return response.text().then(text => {
+                        if (logOffset === null && total > 65536) {
+                            // Drop the partial first line of the tail window
+                            text = text.slice(text.indexOf('\n') + 1);
+                        }
+                        logOffset = total !== null ? total : parseInt(response.headers.get('Content-Length'), 10);
+                        // Keep the last 50 lines (plus the empty string after the final newline)
+                        logTail = (logTail + text).split('\n').slice(-51).join('\n');
+                        document.getElementById('logs').textContent = logTail;
+                    });
+                })
+                .catch(error => console.error('Error:', error));
+        }
+        
         // Update status every 5 seconds
         setInterval(updateStatus, 5000);
+        setInterval(loadLogs, 5000);
         
         // Initial load
         updateStatus();
         getStats();
+        loadLogs();
     </script>
 </body>
 </html>
 '''
 
+# The dashboard is static apart from the optional "Last Error" line, so split
+# the template around that block once and only splice in the error per request
+_DASHBOARD_PREFIX, _, _rest = DASHBOARD_TEMPLATE.partition('{% if publisher_status.last_error %}')
+_, _, _DASHBOARD_SUFFIX = _rest.partition('{% endif %}')
+_DASHBOARD_PREFIX = _DASHBOARD_PREFIX.encode('utf-8')
+_DASHBOARD_SUFFIX = _DASHBOARD_SUFFIX.encode('utf-8')
+del _rest
+
+# 1-slot memo of the rendered error line as an (error, html) pair
+_last_error_html = (None, b'')
+
+def _render_last_error(error):
+    """Render the escaped "Last Error" line, reusing the previous render if unchanged"""
+    global _last_error_html
+    if not error:
+        return b''
+    cached_error, html = _last_error_html
+    if cached_error != error:
+        html = (
+            '<p><strong>Last Error:</strong> <span style="color: #e74c3c;">'
+            f'{escape(error)}</span></p>'
+        ).encode('utf-8')
+        _last_error_html = (error, html)
+    return html
+
 def run_publisher():
     """Run the publisher in a separate thread"""
     global publisher_status
     
     try:
-        publisher_status['is_running'] = True
-        publisher_status['current_status'] = 'running'
-        publisher_status['last_error'] = None
+        with _status_lock:
+            publisher_status['is_running'] = True
+            publisher_status['current_status'] = 'running'
+            publisher_status['last_error'] = None
         
         logger.info("Starting publisher from API call")
-        publisher = NewsPublisher()
+        publisher = get_news_publisher()
         publisher.run_pipeline()
         
-        publisher_status['is_running'] = False
-        publisher_status['current_status'] = 'completed'
-        publisher_status['last_run'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        publisher_status['articles_published'] += 1
+        with _status_lock:
+            publisher_status['is_running'] = False
+            publisher_status['current_status'] = 'completed'
+            publisher_status['last_run'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            publisher_status['articles_published'] += 1
+        
+        # New articles may have been stored, force the next stats call to hit the DB
+        _stats_cache['ts'] = 0.0
         
         logger.info("Publisher completed successfully")
         
     except Exception as e:
-        publisher_status['is_running'] = False
-        publisher_status['current_status'] = 'error'
-        publisher_status['last_error'] = str(e)
+        with _status_lock:
+            publisher_status['is_running'] = False
+            publisher_status['current_status'] = 'error'
+            publisher_status['last_error'] = str(e)
         logger.error(f"Publisher failed: {str(e)}")
 
+# Number of log lines returned by /api/logs
+LOG_TAIL_LINES = 50
+
+# Last tail served, as a (path, size, tail) triple
+_log_tail_cache = (None, -1, '')
+
+# Polls within this many seconds of the last file check share its result without touching the file
+_LOG_TAIL_MIN_INTERVAL = 1.0
+_log_tail_checked = (None, 0.0)
+
+# Log file descriptor kept open between requests, reopened when the file is replaced
+_LOG_FD = {'path': None, 'fd': None, 'ino': None}
+_log_fd_lock = threading.Lock()
+
+def _read_log_tail(log_file, num_lines=LOG_TAIL_LINES):
+    """
+    Return the last num_lines lines of log_file
+    Walks backwards over an mmap of the file so only the tail is decoded
+    Raises FileNotFoundError if the log file doesn't exist
+    """
+    global _log_tail_cache, _log_tail_checked
+    checked_path, checked_at = _log_tail_checked
+    now = time.monotonic()
+    if checked_path == log_file and now - checked_at < _LOG_TAIL_MIN_INTERVAL:
+        cached_path, _, cached_tail = _log_tail_cache
+        if cached_path == log_file:
+            return cached_tail
+    
+    st = os.stat(log_file)
+    _log_tail_checked = (log_file, now)
+    size = st.st_size
+    
+    with _log_fd_lock:
+        cached_path, cached_size, cached_tail = _log_tail_cache
+        if cached_path == log_file and cached_size == size and _LOG_FD['ino'] == st.st_ino:
+            return cached_tail
+        
+        if _LOG_FD['path'] != log_file or _LOG_FD['ino'] != st.st_ino:
+            if _LOG_FD['fd'] is not None:
+                os.close(_LOG_FD['fd'])
+                _LOG_FD['fd'] = None
+            _LOG_FD['fd'] = os.open(log_file, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+            _LOG_FD['path'] = log_file
+            _LOG_FD['ino'] = st.st_ino
+        
+        if size == 0:
+            tail = ''
+        else:
+            with mmap.mmap(_LOG_FD['fd'], size, access=mmap.ACCESS_READ) as mm:
+                # A trailing newline terminates the last line rather than starting a new one
+                end = size - 1 if mm[size - 1] == 0x0A else size
+                start = 0
+                for _ in range(num_lines):
+                    newline = mm.rfind(b'\n', 0, end)
+                    if newline < 0:
+                        start = 0
+                        break
+                    start = newline + 1
+                    end = newline
+                tail = mm[start:size].decode('utf-8', 'replace')
+        
+        _log_tail_cache = (log_file, size, tail)
+        return tail
+
+# Static parts of the GET /api/start page, split around the two timestamps
+_START_PREFIX_HTML = b'''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>'''
+_START_MID_HTML = b''' - Extractor Started</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        }
+        .container {
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            padding: 40px;
+            text-align: center;
+            max-width: 600px;
+        }
+        h1 {
+            color: #2c3e50;
+            margin-bottom: 20px;
+        }
+        .status {
+            background: #27ae60;
+            color: white;
+            padding: 15px;
+            border-radius: 10px;
+            margin: 20px 0;
+            font-size: 18px;
+        }
+        .info {
+            color: #7f8c8d;
+            margin-top: 20px;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>'''
+_START_SUFFIX_HTML = b''' - Extractor Started</h1>
+        <div class="status">Publisher Status: Ready to Start</div>
+        <p>Use POST method to actually start the publisher</p>
+        <div class="info">
+            <p>This page shows the current date and time when accessed via GET request</p>
+        </div>
+    </div>
+</body>
+</html>
+'''
+
+_UK_TZ = ZoneInfo('Europe/London')
+
 @app.route('/')
 def dashboard():
     """Main dashboard page"""
-    return render_template_string(DASHBOARD_TEMPLATE, publisher_status=publisher_status)
+    with _status_lock:
+        last_error = publisher_status['last_error']
+    body = b''.join((
+        _DASHBOARD_PREFIX,
+        _render_last_error(last_error),
+        _DASHBOARD_SUFFIX
+    ))
+    response = Response(body, mimetype='text/html')
+    response.content_length = len(body)
+    return response
+
+def _conditional_response(etag_source, make_response):
+    """
+    Build a response with a weak ETag derived from etag_source
+    Returns an empty 304 instead, without calling make_response, if the client already holds that ETag
+    """
+    etag = format(hash(etag_source) & 0xFFFFFFFFFFFFFFFF, 'x')
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = make_response()
+    response.set_etag(etag, weak=True)
+    # Let browsers keep the body but revalidate on every poll
+    response.cache_control.no_cache = True
+    return response
+
+def _conditional_json(etag_source, payload):
+    """jsonify payload behind a weak ETag, see _conditional_response"""
+    return _conditional_response(etag_source, lambda: jsonify(payload))
 
 @app.route('/api/status')
 def get_status():
     """Get current publisher status"""
-    return jsonify(publisher_status)
+    with _status_lock:
+        status = dict(publisher_status)
+    return _conditional_json(tuple(status.items()), status)
 
 @app.route('/api/start', methods=['POST','GET'])
 def start_publisher():
     """Start the publisher"""
     global publisher_status
     # Handle POST request - start the publisher
-    if publisher_status['is_running']:
+    # Check and claim the running flag atomically so concurrent requests can't both start a run
+    with _status_lock:
+        already_running = publisher_status['is_running']
+        if not already_running:
+            publisher_status['is_running'] = True
+            publisher_status['current_status'] = 'starting'
+    if already_running:
         return jsonify({
             'success': False,
             'message': 'Publisher is already running'
@@ -322,72 +610,16 @@ def start_publisher():
 
    
     
-    # Start publisher in a separate thread
-    thread = threading.Thread(target=run_publisher)
-    thread.daemon = True
-    thread.start()
+    # Hand the run to the publisher executor
+    _publisher_executor.submit(run_publisher)
     
     if request.method == 'GET':
         # Get UK time
-        uk_tz = pytz.timezone('Europe/London')
-        current_time = datetime.now(uk_tz).strftime('%Y-%m-%d %H:%M:%S')
-        html_content = f'''
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{current_time} - Extractor Started</title>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    margin: 0;
-                    padding: 20px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                }}
-                .container {{
-                    background: white;
-                    border-radius: 15px;
-                    box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                    padding: 40px;
-                    text-align: center;
-                    max-width: 600px;
-                }}
-                h1 {{
-                    color: #2c3e50;
-                    margin-bottom: 20px;
-                }}
-                .status {{
-                    background: #27ae60;
-                    color: white;
-                    padding: 15px;
-                    border-radius: 10px;
-                    margin: 20px 0;
-                    font-size: 18px;
-                }}
-                .info {{
-                    color: #7f8c8d;
-                    margin-top: 20px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>{current_time} - Extractor Started</h1>
-                <div class="status">Publisher Status: Ready to Start</div>
-                <p>Use POST method to actually start the publisher</p>
-                <div class="info">
-                    <p>This page shows the current date and time when accessed via GET request</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        '''
-        return html_content
+        current_time = datetime.now(_UK_TZ).strftime('%Y-%m-%d %H:%M:%S').encode('ascii')
+        return Response(
+            b''.join((_START_PREFIX_HTML, current_time, _START_MID_HTML, current_time, _START_SUFFIX_HTML)),
+            mimetype='text/html'
+        )
     
     return jsonify({
         'success': True,
@@ -399,15 +631,18 @@ def stop_publisher():
     """Stop the publisher (if running)"""
     global publisher_status
     
-    if not publisher_status['is_running']:
+    with _status_lock:
+        was_running = publisher_status['is_running']
+        if was_running:
+            publisher_status['is_running'] = False
+            publisher_status['current_status'] = 'stopped'
+    
+    if not was_running:
         return jsonify({
             'success': False,
             'message': 'Publisher is not running'
         }), 400
     
-    publisher_status['is_running'] = False
-    publisher_status['current_status'] = 'stopped'
-    
     return jsonify({
         'success': True,
         'message': 'Publisher stopped successfully'
@@ -417,20 +652,32 @@ def stop_publisher():
 def get_stats():
     """Get database statistics"""
     try:
-        if db_manager.collection is None:
+        db_manager = _get_db_manager()
+        if db_manager is None:
             return jsonify({
                 'success': False,
                 'message': 'Database not connected'
             }), 500
         
-        stats = db_manager.get_stats()
-        return jsonify({
+        with _stats_lock:
+            now = time.monotonic()
+            if _stats_cache['val'] is None or now - _stats_cache['ts'] > _STATS_TTL:
+                stats = db_manager.get_stats()
+                # Don't hold on to failed lookups
+                if 'error' not in stats:
+                    _stats_cache['val'] = stats
+                    _stats_cache['ts'] = now
+            else:
+                stats = _stats_cache['val']
+        
+        payload = {
             'success': True,
             'total_articles': stats.get('total_articles', 0),
             'today_articles': stats.get('today_articles', 0),
             'last_article': stats.get('most_recent'),
             'last_article_date': stats.get('most_recent_date')
-        })
+        }
+        return _conditional_json(tuple(payload.items()), payload)
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}")
         return jsonify({
@@ -442,7 +689,8 @@ def get_stats():
 def get_articles():
     """Get list of published articles"""
     try:
-        if db_manager.collection is None:
+        db_manager = _get_db_manager()
+        if db_manager is None:
             return jsonify({
                 'success': False,
                 'message': 'Database not connected'
@@ -463,35 +711,64 @@ def get_articles():
             'message': f'Error getting articles: {str(e)}'
         }), 500
 
+# Static pieces of the /api/health JSON body (keys in jsonify's sorted order)
+_HEALTH_PREFIX = b'{"database_connected":'
+_HEALTH_MID1 = b',"publisher_running":'
+_HEALTH_MID2 = b',"status":"healthy","timestamp":"'
+_HEALTH_SUFFIX = b'"}\n'
+_JSON_BOOL = {True: b'true', False: b'false'}
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'database_connected': db_manager.collection is not None,
-        'publisher_running': publisher_status['is_running']
-    })
+    with _status_lock:
+        publisher_running = publisher_status['is_running']
+    database_connected = _get_db_manager() is not None
+    
+    def make_response():
+        timestamp = datetime.now().isoformat().encode('ascii')
+        return Response(
+            b''.join((
+                _HEALTH_PREFIX, _JSON_BOOL[database_connected],
+                _HEALTH_MID1, _JSON_BOOL[publisher_running],
+                _HEALTH_MID2, timestamp, _HEALTH_SUFFIX
+            )),
+            mimetype='application/json'
+        )
+    
+    # The ETag ignores the timestamp, a 304 means the health state is unchanged
+    return _conditional_response((database_connected, publisher_running), make_response)
+
+@app.route('/api/ready')
+def readiness_check():
+    """Readiness check endpoint, pings the database through the shared connection pool"""
+    db_manager = _get_db_manager()
+    if db_manager is None or not db_manager.ping():
+        return jsonify({
+            'ready': False,
+            'message': 'Database not reachable'
+        }), 503
+    return jsonify({'ready': True})
+
+def _wants_plain_text():
+    """True if the client prefers a text/plain response over JSON"""
+    return request.accept_mimetypes.best_match(['application/json', 'text/plain']) == 'text/plain'
 
 @app.route('/api/logs')
 def get_logs():
     """Get recent logs"""
+    if _wants_plain_text():
+        return get_logs_raw()
+    
     try:
-        log_file = 'cineulagam_publisher.log'
-        if not os.path.exists(log_file):
-            return jsonify({
-                'success': True,
-                'logs': 'No log file found'
-            })
-        
-        # Read last 50 lines
-        with open(log_file, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            recent_lines = lines[-50:] if len(lines) > 50 else lines
-        
         return jsonify({
             'success': True,
-            'logs': ''.join(recent_lines)
+            'logs': _read_log_tail(LOG_FILE)
+        })
+    except FileNotFoundError:
+        return jsonify({
+            'success': True,
+            'logs': 'No log file found'
         })
     except Exception as e:
         logger.error(f"Error reading logs: {str(e)}")
@@ -500,9 +777,22 @@ def get_logs():
             'message': f'Error reading logs: {str(e)}'
         }), 500
 
+@app.route('/api/logs/raw')
+def get_logs_raw():
+    """Serve the raw log file, with Range support so clients can fetch only new bytes"""
+    try:
+        return send_file(
+            os.path.abspath(LOG_FILE),
+            mimetype='text/plain',
+            conditional=True,
+            max_age=0
+        )
+    except FileNotFoundError:
+        return Response('No log file found', status=404, mimetype='text/plain')
+
 if __name__ == '__main__':
     # Initialize database connection
-    if db_manager.collection is None:
+    if _get_db_manager() is None:
         logger.error("Failed to connect to database. Please check your MongoDB configuration.")
         sys.exit(1)
     
@@ -510,7 +800,7 @@ if __name__ == '__main__':
     logger.info("Dashboard available at: http://localhost:5000")
     logger.info("API endpoints available at: http://localhost:5000/api/")
     
-    # Run Flask app
+    # Run Flask development server (production uses gunicorn, see wsgi.py)
     app.run(
         host='0.0.0.0',  # Allow external connections
         port=5000,
@@ -5,13 +5,21 @@ Blogger API integration for publishing articles
 Handles authentication and post publishing to Google Blogger
 """
 
+import html
+import json
 import logging
 import os
-from typing import Optional, Dict
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List
+from cachetools import TTLCache
 from googleapiclient.discovery import build
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
 import pickle
 import base64
 from datetime import datetime
@@ -21,6 +29,19 @@ logger = logging.getLogger(__name__)
 # Blogger API scopes
 SCOPES = ['https://www.googleapis.com/auth/blogger']
 
+# Socket timeout, and retry count (429/5xx, exponential backoff) for read-only Blogger API calls
+HTTP_TIMEOUT = 60
+NUM_RETRIES = 3
+
+# Concurrent inserts used by publish_posts
+PUBLISH_WORKERS = 4
+
+# Seconds a list_posts result is reused before asking Blogger again
+POSTS_CACHE_TTL = 60
+
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\n+')
+_SOURCE_ATTRIBUTION_HTML = ['<hr>', '<p><em>Source: Entertainment News</em></p>']
+
 
 class BloggerPublisher:
     """Handles Blogger API operations for publishing articles"""
@@ -28,9 +49,19 @@ class BloggerPublisher:
     def __init__(self):
         """Initialize Blogger API client"""
         self.service = None
+        self.credentials = None
+        # httplib2 connections are not thread-safe, so each thread gets its own service
+        self._local = threading.local()
+        # Blog info rarely changes, recent posts are cached per max_results until the next publish
+        self._blog_info = None
+        self._posts_cache = TTLCache(maxsize=8, ttl=POSTS_CACHE_TTL)
+        self._posts_cache_lock = threading.Lock()
         self.blog_id = os.getenv('BLOGGER_BLOG_ID',"6380171182056049355")
         self.credentials_file = os.getenv('BLOGGER_CREDENTIALS_FILE', 'credentials.json')
-        self.token_file = os.getenv('BLOGGER_TOKEN_FILE', 'token.pickle')
+        self.token_file = os.getenv('BLOGGER_TOKEN_FILE', 'token.json')
+        if self.token_file.endswith('.pickle'):
+            # Older configs point at the pickle token, keep its location but store JSON
+            self.token_file = os.path.splitext(self.token_file)[0] + '.json'
         
         if not self.blog_id:
             logger.error("BLOGGER_BLOG_ID not found in environment variables")
@@ -44,9 +75,7 @@ class BloggerPublisher:
             creds = None
             
             # Load existing token
-            if os.path.exists(self.token_file):
-                with open(self.token_file, 'rb') as token:
-                    creds = pickle.load(token)
+            creds = self._load_token()
             
             # If no valid credentials, get new ones
             if not creds or not creds.valid:
@@ -75,11 +104,12 @@ class BloggerPublisher:
                         return
                 
                 # Save credentials for next run
-                with open(self.token_file, 'wb') as token:
-                    pickle.dump(creds, token)
+                self._save_token(creds)
             
             # Build the service
-            self.service = build('blogger', 'v3', credentials=creds)
+            self.credentials = creds
+            self.service = self._build_service()
+            self._local.service = self.service
             logger.info("Successfully authenticated with Blogger API")
             
         except Exception as e:
@@ -87,6 +117,63 @@ class BloggerPublisher:
             logger.error("Please check your credentials.json file format")
             self.service = None
     
+    def _load_token(self) -> Optional[Credentials]:
+        """Load saved OAuth credentials from the JSON token file"""
+        if os.path.exists(self.token_file):
+            with open(self.token_file, 'r', encoding='utf-8') as token:
+                return Credentials.from_authorized_user_info(json.load(token), SCOPES)
+        
+        # One-time migration from the pickle token written by older versions
+        legacy_token_file = os.path.splitext(self.token_file)[0] + '.pickle'
+        if os.path.exists(legacy_token_file):
+            with open(legacy_token_file, 'rb') as token:
+                creds = pickle.load(token)
+            logger.info(f"Migrating Blogger token from {legacy_token_file} to {self.token_file}")
+            self._save_token(creds)
+            return creds
+        
+        return None
+    
+    def _save_token(self, creds: Credentials):
+        """Save OAuth credentials to the JSON token file"""
+        try:
+            with open(self.token_file, 'w', encoding='utf-8') as token:
+                token.write(creds.to_json())
+        except OSError as e:
+            logger.warning(f"Could not save Blogger token to {self.token_file}: {str(e)}")
+    
+    def _build_service(self):
+        """Build a Blogger service with its own persistent authorized HTTP client"""
+        # One authorized HTTP client for every call, so the connection to
+        # Google stays open between requests instead of being re-established
+        http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+        
+        # Use the discovery document bundled with the client library instead of fetching it
+        return build('blogger', 'v3', http=http, static_discovery=True)
+    
+    def _get_service(self):
+        """Return the Blogger service for the calling thread"""
+        service = getattr(self._local, 'service', None)
+        if service is None:
+            service = self._build_service()
+            self._local.service = service
+        return service
+    
+    def publish_posts(self, articles: List[Dict[str, str]]) -> List[Optional[Dict[str, str]]]:
+        """
+        Publish several articles concurrently
+        Returns post details (or None on failure) in the same order as articles
+        """
+        if not self.service:
+            logger.error("Blogger service not initialized")
+            return [None] * len(articles)
+        
+        if len(articles) <= 1:
+            return [self.publish_post(article) for article in articles]
+        
+        with ThreadPoolExecutor(max_workers=min(PUBLISH_WORKERS, len(articles))) as executor:
+            return list(executor.map(self.publish_post, articles))
+    
     def publish_post(self, article: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
         Publish an article to Blogger
@@ -138,11 +225,12 @@ class BloggerPublisher:
             # Publish the post
             logger.info(f"Publishing post: {title}")
             logger.info(f"Using labels: {labels}")
-            request = self.service.posts().insert(
+            request = self._get_service().posts().insert(
                 blogId=self.blog_id,
                 body=post_body
             )
             
+            # Inserts are not retried, a retry after a lost response would duplicate the post
             post = request.execute()
             
             # Extract post details
@@ -151,6 +239,10 @@ class BloggerPublisher:
             
             logger.info(f"Successfully published post: {post_url}")
             
+            # The recent posts list now includes this post
+            with self._posts_cache_lock:
+                self._posts_cache.clear()
+            
             return {
                 'id': post_id,
                 'url': post_url,
@@ -164,40 +256,37 @@ class BloggerPublisher:
     
     def _create_html_content(self, content: str, image_url: Optional[str] = None) -> str:
         """Create HTML content for the blog post"""
-        html_parts = []
+        # Convert blank-line separated blocks to HTML paragraphs and single line breaks to <br>
+        paragraphs = [
+            '<p>' + paragraph.replace('\n', '<br>') + '</p>'
+            for paragraph in map(str.strip, _PARAGRAPH_SPLIT_RE.split(content))
+            if paragraph
+        ]
         
+        header = []
         # Add image if available
         if image_url:
-            html_parts.append(f'<img src="{image_url}" alt="Featured Image" style="max-width: 100%; height: auto; margin-bottom: 20px;">')
-        
-        # Add content
-        # Convert line breaks to HTML paragraphs
-        paragraphs = content.split('\n\n')
-        for paragraph in paragraphs:
-            paragraph = paragraph.strip()
-            if paragraph:
-                # Convert single line breaks to <br>
-                paragraph = paragraph.replace('\n', '<br>')
-                html_parts.append(f'<p>{paragraph}</p>')
+            header.append(f'<img src="{html.escape(image_url)}" alt="Featured Image" style="max-width: 100%; height: auto; margin-bottom: 20px;">')
         
         # Add source attribution
-        html_parts.append('<hr>')
-        html_parts.append('<p><em>Source: Entertainment News</em></p>')
-        
-        return '\n'.join(html_parts)
+        return '\n'.join(header + paragraphs + _SOURCE_ATTRIBUTION_HTML)
     
     def get_blog_info(self) -> Optional[Dict]:
         """Get blog information"""
         if not self.service:
             return None
         
+        if self._blog_info is not None:
+            return self._blog_info
+        
         try:
-            blog = self.service.blogs().get(blogId=self.blog_id).execute()
-            return {
+            blog = self._get_service().blogs().get(blogId=self.blog_id).execute(num_retries=NUM_RETRIES)
+            self._blog_info = {
                 'name': blog.get('name'),
                 'url': blog.get('url'),
                 'description': blog.get('description')
             }
+            return self._blog_info
         except Exception as e:
             logger.error(f"Failed to get blog info: {str(e)}")
             return None
@@ -207,14 +296,22 @@ class BloggerPublisher:
         if not self.service:
             return []
         
+        with self._posts_cache_lock:
+            cached = self._posts_cache.get(max_results)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            request = self.service.posts().list(
+            request = self._get_service().posts().list(
                 blogId=self.blog_id,
                 maxResults=max_results,
                 status='LIVE'
             )
-            posts = request.execute()
-            return posts.get('items', [])
+            posts = request.execute(num_retries=NUM_RETRIES)
+            items = posts.get('items', [])
+            with self._posts_cache_lock:
+                self._posts_cache[max_results] = items
+            return list(items)
         except Exception as e:
             logger.error(f"Failed to list posts: {str(e)}")
             return []
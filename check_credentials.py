@@ -6,15 +6,27 @@ Script to check if credentials.json is properly formatted for Blogger API
 import json
 import os
 
-def check_credentials():
+# Result of the last check, reused while the file is unchanged
+_cred_cache = {'path': None, 'mtime': 0, 'ok': None}
+
+def check_credentials(credentials_file='credentials.json'):
     """Check if credentials.json is properly formatted"""
-    credentials_file = 'credentials.json'
-    
-    if not os.path.exists(credentials_file):
+    try:
+        st = os.stat(credentials_file)
+    except FileNotFoundError:
         print("❌ credentials.json file not found!")
         print("Please download it from Google Cloud Console and place it in the current directory.")
         return False
     
+    if _cred_cache['path'] == credentials_file and _cred_cache['mtime'] == st.st_mtime_ns:
+        return _cred_cache['ok']
+    
+    ok = _check_credentials_file(credentials_file)
+    _cred_cache.update(path=credentials_file, mtime=st.st_mtime_ns, ok=ok)
+    return ok
+
+def _check_credentials_file(credentials_file):
+    """Parse and validate the credentials file, printing what was found"""
     try:
         with open(credentials_file, 'r') as f:
             creds = json.load(f)
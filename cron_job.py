@@ -10,19 +10,14 @@ import os
 from datetime import datetime
 from dotenv import load_dotenv
 
+from logging_config import setup_logging
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging for cron
 log_file = os.getenv('LOG_FILE', 'cineulagam_publisher.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+setup_logging(log_file)
 
 logger = logging.getLogger(__name__)
 
@@ -35,9 +30,9 @@ def main():
         logger.info("="*60)
         
         # Import and run the main publisher
-        from main import NewsPublisher
+        from main import get_news_publisher
         
-        publisher = NewsPublisher()
+        publisher = get_news_publisher()
         publisher.run_pipeline()
         
         logger.info("="*60)
@@ -6,14 +6,33 @@ Handles database operations and article tracking
 
 import logging
 import os
-from datetime import datetime
-from typing import Optional, Dict, Any
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, DuplicateKeyError
-import urllib.parse
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterator, List, Set
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, OperationFailure
 
 logger = logging.getLogger(__name__)
 
+# Timestamps are stored in UTC
+UTC = timezone.utc
+
+# Maximum documents sent per bulk_write call
+BULK_WRITE_BATCH_SIZE = 1000
+
+# Documents per cursor batch when streaming every posted URL
+POSTED_URLS_BATCH_SIZE = 5000
+
+# Maximum documents per cursor batch when streaming posted articles
+ARTICLES_BATCH_SIZE = 200
+
+# Indexes created by older versions, dropped by ensure_indexes()
+LEGACY_INDEXES = ("posted_at_1", "blogger_id_1")
+
+# Process-wide DatabaseManager returned by DatabaseManager.get()
+_INSTANCE = None
+_INSTANCE_LOCK = threading.Lock()
+
 
 class DatabaseManager:
     """Handles MongoDB operations for article tracking"""
@@ -31,19 +50,34 @@ class DatabaseManager:
         
         if not self.mongo_uri:
             logger.error("MONGODB_URI not found in environment variables")
-            return
+            raise RuntimeError("MONGODB_URI not set")
         
         self._connect()
     
+    @classmethod
+    def get(cls) -> 'DatabaseManager':
+        """
+        Return the shared DatabaseManager, connecting on first use
+        Raises RuntimeError if the database cannot be reached (the next call retries)
+        """
+        global _INSTANCE
+        with _INSTANCE_LOCK:
+            if _INSTANCE is None:
+                _INSTANCE = cls()
+            return _INSTANCE
+    
     def _connect(self):
-        """Establish connection to MongoDB Atlas"""
+        """Establish connection to MongoDB Atlas, raising RuntimeError on failure"""
         try:
-            # Parse the URI to ensure proper encoding
-            parsed_uri = urllib.parse.urlparse(self.mongo_uri)
-            
             # Create MongoDB client
             self.client = MongoClient(
                 self.mongo_uri,
+                appname="cineulagam-publisher",
+                maxPoolSize=10,  # A single publisher process needs only a few connections
+                minPoolSize=1,  # Keep one warm connection to skip TLS handshakes
+                waitQueueTimeoutMS=2000,  # Fail fast when the pool is exhausted
+                compressors="zstd,zlib",  # Compress wire traffic to Atlas
+                readPreference="primaryPreferred",
                 serverSelectionTimeoutMS=5000,  # 5 second timeout
                 connectTimeoutMS=10000,  # 10 second timeout
                 socketTimeoutMS=20000,  # 20 second timeout
@@ -57,78 +91,136 @@ class DatabaseManager:
             self.db = self.client[self.database_name]
             self.collection = self.db[self.collection_name]
             
-            # Create indexes for better performance
-            self._create_indexes()
+            # Indexes are created once via `deploy.py bootstrap`, or here when bootstrapping
+            if os.getenv('CINEULAGAM_BOOTSTRAP') == '1':
+                self.ensure_indexes()
             
             logger.info(f"Successfully connected to MongoDB Atlas: {self.database_name}.{self.collection_name}")
             
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB Atlas: {str(e)}")
-            self.client = None
+            self.close_connection()
+            raise RuntimeError(f"Failed to connect to MongoDB Atlas: {str(e)}") from e
         except Exception as e:
             logger.error(f"Unexpected error connecting to MongoDB: {str(e)}")
-            self.client = None
+            self.close_connection()
+            raise RuntimeError(f"Unexpected error connecting to MongoDB: {str(e)}") from e
     
-    def _create_indexes(self):
-        """Create necessary indexes for better performance"""
+    def ensure_indexes(self) -> bool:
+        """
+        Create missing indexes and drop legacy ones
+        Returns True if successful, False otherwise
+        """
         try:
+            try:
+                existing = {index["name"] for index in self.collection.list_indexes()}
+            except OperationFailure:
+                # Collection does not exist yet on the first ever run
+                existing = set()
+            
+            created = []
+            
             # Create unique index on URL to prevent duplicates
-            self.collection.create_index("url", unique=True)
+            if "url_1" not in existing:
+                created.append(self.collection.create_index("url", unique=True, name="url_1"))
             
-            # Create index on posted_at for time-based queries
-            self.collection.create_index("posted_at")
+            # Create descending index on posted_at for newest-first queries
+            if "posted_at_-1" not in existing:
+                created.append(self.collection.create_index([("posted_at", -1)], name="posted_at_-1"))
             
-            # Create index on blogger_id for cross-referencing
-            self.collection.create_index("blogger_id")
+            # Drop indexes from older versions that no query uses any more
+            for name in LEGACY_INDEXES:
+                if name in existing:
+                    self.collection.drop_index(name)
+                    logger.info(f"Dropped legacy index: {name}")
             
-            logger.info("Database indexes created successfully")
+            if created:
+                logger.info(f"Database indexes created successfully: {', '.join(created)}")
+            return True
             
         except Exception as e:
             logger.warning(f"Failed to create indexes: {str(e)}")
+            return False
     
     def is_article_posted(self, url: str) -> bool:
         """
         Check if an article has already been posted
         Returns True if article exists, False otherwise
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return False
-        
         try:
-            result = self.collection.find_one({"url": url})
+            # Projecting only the indexed field lets the url index cover the query
+            result = self.collection.find_one({"url": url}, projection={"url": 1, "_id": 0})
             return result is not None
             
         except Exception as e:
             logger.error(f"Error checking if article is posted: {str(e)}")
             return False
     
+    def get_posted_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Check many articles in one query
+        Returns the subset of urls that have already been posted
+        """
+        if not urls:
+            return set()
+        
+        try:
+            cursor = self.collection.find({"url": {"$in": urls}}, projection={"url": 1, "_id": 0})
+            return {doc["url"] for doc in cursor}
+            
+        except Exception as e:
+            logger.error(f"Error checking posted articles: {str(e)}")
+            return set()
+    
+    def load_all_posted_urls(self) -> Set[str]:
+        """
+        Load the URLs of every posted article in one streamed scan
+        Returns a set of URLs (empty if the lookup fails)
+        """
+        try:
+            # The range filter lets the unique url index cover the scan, so no documents are fetched
+            cursor = self.collection.find(
+                {"url": {"$gt": ""}},
+                projection={"url": 1, "_id": 0}
+            ).batch_size(POSTED_URLS_BATCH_SIZE)
+            return {doc["url"] for doc in cursor}
+            
+        except Exception as e:
+            logger.error(f"Error loading posted articles: {str(e)}")
+            return set()
+    
+    @staticmethod
+    def build_article_doc(url: str, title: str, blogger_id: str, posted_at: datetime) -> Dict[str, Any]:
+        """Build the document stored for a posted article"""
+        return {
+            "url": url,
+            "title": title,
+            "blogger_id": blogger_id,
+            "posted_at": posted_at,
+            "created_at": datetime.now(UTC)
+        }
+    
+    def try_claim_article(self, url: str, article_doc: Dict[str, Any]) -> bool:
+        """
+        Atomically record an article unless its URL is already stored
+        Returns True if this call inserted it, False if it already existed
+        """
+        result = self.collection.update_one({"url": url}, {"$setOnInsert": article_doc}, upsert=True)
+        return result.upserted_id is not None
+    
     def store_posted_article(self, url: str, title: str, blogger_id: str, posted_at: datetime) -> bool:
         """
         Store information about a posted article
         Returns True if successful, False otherwise
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return False
-        
         try:
-            article_doc = {
-                "url": url,
-                "title": title,
-                "blogger_id": blogger_id,
-                "posted_at": posted_at,
-                "created_at": datetime.now()
-            }
-            
-            result = self.collection.insert_one(article_doc)
+            article_doc = self.build_article_doc(url, title, blogger_id, posted_at)
             
-            if result.inserted_id:
+            if self.try_claim_article(url, article_doc):
                 logger.info(f"Successfully stored article: {title}")
-                return True
             else:
-                logger.error("Failed to store article - no inserted ID")
-                return False
+                logger.warning(f"Article already exists in database: {url}")
+            return True
                 
         except DuplicateKeyError:
             logger.warning(f"Article already exists in database: {url}")
@@ -137,38 +229,71 @@ class DatabaseManager:
             logger.error(f"Error storing article: {str(e)}")
             return False
     
-    def get_posted_articles(self, limit: int = 100) -> list:
+    def bulk_store_posted_articles(self, docs: List[Dict[str, Any]]) -> int:
         """
-        Get list of posted articles
-        Returns list of article documents
+        Store several posted articles with unordered bulk upserts
+        Articles whose URL is already stored are left untouched
+        Returns the number of documents inserted
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return []
+        inserted = 0
+        for start in range(0, len(docs), BULK_WRITE_BATCH_SIZE):
+            batch = docs[start:start + BULK_WRITE_BATCH_SIZE]
+            requests = [
+                UpdateOne({"url": doc["url"]}, {"$setOnInsert": doc}, upsert=True)
+                for doc in batch
+            ]
+            try:
+                result = self.collection.bulk_write(requests, ordered=False)
+                inserted += result.upserted_count
+                if result.upserted_count < len(batch):
+                    logger.warning(f"{len(batch) - result.upserted_count} articles already exist in database")
+            except BulkWriteError as e:
+                inserted += e.details.get('nUpserted', 0)
+                for error in e.details.get('writeErrors', []):
+                    if error.get('code') == 11000:
+                        # Another writer inserted the same URL concurrently
+                        logger.warning(f"Article already exists in database: {error.get('op', {}).get('q', {}).get('url')}")
+                    else:
+                        logger.error(f"Error storing article: {error.get('errmsg')}")
+            except Exception as e:
+                logger.error(f"Error storing articles: {str(e)}")
         
+        if inserted:
+            logger.info(f"Successfully stored {inserted} articles")
+        return inserted
+    
+    def iter_posted_articles(self, limit: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream posted articles, newest first
+        Yields article documents as the cursor is consumed
+        """
         try:
-            cursor = self.collection.find().sort("posted_at", -1).limit(limit)
-            articles = list(cursor)
+            # Fetch only the displayed fields
+            cursor = self.collection.find(
+                {},
+                projection={"title": 1, "posted_at": 1, "url": 1, "blogger_id": 1}
+            ).sort("posted_at", -1).limit(limit).batch_size(min(limit, ARTICLES_BATCH_SIZE))
             
-            # Convert ObjectId to string for JSON serialization
-            for article in articles:
+            for article in cursor:
+                # Convert ObjectId to string for JSON serialization
                 article['_id'] = str(article['_id'])
-            
-            return articles
-            
+                yield article
+                
         except Exception as e:
             logger.error(f"Error getting posted articles: {str(e)}")
-            return []
+    
+    def get_posted_articles(self, limit: int = 100) -> list:
+        """
+        Get list of posted articles
+        Returns list of article documents
+        """
+        return list(self.iter_posted_articles(limit))
     
     def get_article_by_url(self, url: str) -> Optional[Dict[str, Any]]:
         """
         Get article details by URL
         Returns article document or None
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return None
-        
         try:
             article = self.collection.find_one({"url": url})
             if article:
@@ -184,13 +309,11 @@ class DatabaseManager:
         Get the URL of the most recently posted article
         Returns URL string or None if no articles found
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return None
-        
         try:
             # Get the most recent article by posted_at date
             last_article = self.collection.find_one(
+                {},
+                projection={"url": 1, "title": 1, "_id": 0},
                 sort=[("posted_at", -1)]
             )
             
@@ -210,10 +333,6 @@ class DatabaseManager:
         Delete an article from the database
         Returns True if successful, False otherwise
         """
-        if self.collection is None:
-            logger.error("Database not connected")
-            return False
-        
         try:
             result = self.collection.delete_one({"url": url})
             return result.deleted_count > 0
@@ -227,14 +346,12 @@ class DatabaseManager:
         Get database statistics
         Returns dictionary with various stats
         """
-        if self.collection is None:
-            return {"error": "Database not connected"}
-        
         try:
-            total_articles = self.collection.count_documents({})
+            # Metadata count; exact totals are not needed for dashboard stats
+            total_articles = self.collection.estimated_document_count()
             
             # Get articles posted today
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
             today_articles = self.collection.count_documents({"posted_at": {"$gte": today}})
             
             # Get most recent article
@@ -253,10 +370,23 @@ class DatabaseManager:
             logger.error(f"Error getting stats: {str(e)}")
             return {"error": str(e)}
     
+    def ping(self) -> bool:
+        """
+        Check the database round-trip over a pooled connection
+        Returns True if the server responded, False otherwise
+        """
+        try:
+            self.client.admin.command('ping')
+            return True
+        except Exception as e:
+            logger.error(f"Database ping failed: {str(e)}")
+            return False
+    
     def close_connection(self):
         """Close MongoDB connection"""
         if self.client:
             self.client.close()
+            self.client = None
             logger.info("MongoDB connection closed")
     
     def __del__(self):
@@ -25,14 +25,18 @@ logger = logging.getLogger(__name__)
 
 def run_tests():
     """Run connection tests"""
+    from test_connection import main as run_tests_main
+    
     logger.info("Running connection tests...")
-    os.system("python test_connection.py")
+    return run_tests_main()
 
 
 def run_publisher():
     """Run the main publisher"""
+    from main import main as run_main
+    
     logger.info("Starting Tamil Cinema News Publisher...")
-    os.system("python main.py")
+    run_main()
 
 
 def check_environment():
@@ -63,14 +67,11 @@ def show_stats():
     try:
         from db import DatabaseManager
         
-        db = DatabaseManager()
-        if db.client:
-            stats = db.get_stats()
-            logger.info("Database Statistics:")
-            for key, value in stats.items():
-                logger.info(f"  {key}: {value}")
-        else:
-            logger.error("Database not connected")
+        db = DatabaseManager.get()
+        stats = db.get_stats()
+        logger.info("Database Statistics:")
+        for key, value in stats.items():
+            logger.info(f"  {key}: {value}")
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}")
 
@@ -80,14 +81,10 @@ def list_recent_articles(limit=10):
     try:
         from db import DatabaseManager
         
-        db = DatabaseManager()
-        if db.client:
-            articles = db.get_posted_articles(limit)
-            logger.info(f"Recent {len(articles)} articles:")
-            for i, article in enumerate(articles, 1):
-                logger.info(f"  {i}. {article['title']} ({article['posted_at']})")
-        else:
-            logger.error("Database not connected")
+        db = DatabaseManager.get()
+        logger.info(f"Recent articles (up to {limit}):")
+        for i, article in enumerate(db.iter_posted_articles(limit), 1):
+            logger.info(f"  {i}. {article['title']} ({article['posted_at']})")
     except Exception as e:
         logger.error(f"Error listing articles: {str(e)}")
 
@@ -97,19 +94,33 @@ def show_last_posted():
     try:
         from db import DatabaseManager
         
-        db = DatabaseManager()
-        if db.client:
-            last_url = db.get_last_posted_article_url()
-            if last_url:
-                logger.info(f"Last posted article URL: {last_url}")
-            else:
-                logger.info("No articles have been posted yet")
+        db = DatabaseManager.get()
+        last_url = db.get_last_posted_article_url()
+        if last_url:
+            logger.info(f"Last posted article URL: {last_url}")
         else:
-            logger.error("Database not connected")
+            logger.info("No articles have been posted yet")
     except Exception as e:
         logger.error(f"Error getting last posted article: {str(e)}")
 
 
+def bootstrap_database():
+    """Create the database indexes (run once per deployment)"""
+    try:
+        from db import DatabaseManager
+        
+        db = DatabaseManager.get()
+        if db.ensure_indexes():
+            logger.info("Database indexes are in place")
+            return True
+        else:
+            logger.error("Failed to create database indexes")
+            return False
+    except Exception as e:
+        logger.error(f"Error bootstrapping database: {str(e)}")
+        return False
+
+
 def send_test_telegram():
     """Send test message to Telegram"""
     try:
@@ -152,6 +163,9 @@ def main():
     # Last posted command
     subparsers.add_parser('last-posted', help='Show last posted article URL')
     
+    # Bootstrap command
+    subparsers.add_parser('bootstrap', help='Create database indexes')
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -175,6 +189,9 @@ def main():
         send_test_telegram()
     elif args.command == 'last-posted':
         show_last_posted()
+    elif args.command == 'bootstrap':
+        if not bootstrap_database():
+            sys.exit(1)
 
 
 if __name__ == "__main__":
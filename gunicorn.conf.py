@@ -0,0 +1,19 @@
+"""
+Gunicorn configuration for the Tamil Cinema News Publisher Flask app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Publisher status and the background publisher thread live in process memory,
+# so a single worker process is used and concurrency comes from its threads
+worker_class = 'gthread'
+workers = 1
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Keep the worker heartbeat file off disk
+worker_tmp_dir = '/dev/shm'
+
+keepalive = 5
+timeout = 120
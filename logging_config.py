@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Shared logging setup for the Tamil Cinema News Publisher
+Log records are queued and written to file/stdout by a background thread
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_QUEUE_SIZE = 10000
+
+_listener = None
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of erroring when the queue is full"""
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class SafeFormatter(logging.Formatter):
+    """Formatter that replaces characters the target stream cannot encode"""
+
+    def __init__(self, fmt=None, encoding=None):
+        super().__init__(fmt)
+        self.encoding = encoding or 'utf-8'
+
+    def format(self, record):
+        message = super().format(record)
+        return message.encode(self.encoding, 'replace').decode(self.encoding, 'replace')
+
+
+def setup_logging(log_file: str = 'cineulagam_publisher.log', level=None):
+    """
+    Configure the root logger to write through a background log-writer thread
+    The level defaults to the LOG_LEVEL environment variable (INFO if unset)
+    Only the first call takes effect, later calls (or calls after the root
+    logger was configured elsewhere) are no-ops
+    """
+    global _listener
+    if _listener is not None or logging.getLogger().handlers:
+        return
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(SafeFormatter(LOG_FORMAT, getattr(sys.stdout, 'encoding', None)))
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    # Records are fully formatted by the writer thread's handlers
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    if level is None:
+        level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    logging.basicConfig(level=level, handlers=[queue_handler])
@@ -7,7 +7,10 @@ Main orchestrator for the news publishing pipeline
 import logging
 import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 # Set UTF-8 encoding for Windows console
@@ -19,23 +22,23 @@ if sys.platform.startswith('win'):
 from scraper import ArticleScraper
 from blogger import BloggerPublisher
 from telegram_bot import TelegramBot
-from db import DatabaseManager
+from db import DatabaseManager, UTC
+from logging_config import setup_logging
 
 # Load environment variables
 load_dotenv('env.env')
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('cineulagam_publisher.log', encoding='utf-8'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+setup_logging('cineulagam_publisher.log')
 
 logger = logging.getLogger(__name__)
 
+# Published articles are recorded in the database in batches of this size
+STORE_BATCH_SIZE = 10
+
+# Number of articles scraped/published at the same time
+PIPELINE_WORKERS = int(os.getenv('PIPELINE_WORKERS', '4'))
+
 
 class NewsPublisher:
     """Main orchestrator class for the news publishing pipeline"""
@@ -45,21 +48,24 @@ class NewsPublisher:
         self.scraper = ArticleScraper()
         self.blogger = BloggerPublisher()
         self.telegram_bot = TelegramBot()
-        self.db = DatabaseManager()
+        self.db = DatabaseManager.get()
         
     def run_pipeline(self):
         """Execute the complete news publishing pipeline"""
+        # Posted-article records waiting to be bulk written to the database
+        pending_docs = []
         try:
             logger.info("Starting Tamil Cinema News Publisher Pipeline")
             
-            # Step 1: Get last posted article URL from database
+            # Step 1: Get last posted article URL and every posted URL from database
             last_posted_url = self.db.get_last_posted_article_url()
+            posted_urls = self.db.load_all_posted_urls()
             
             # Step 2: Fetch only new articles since last post
             if last_posted_url:
                 logger.info(f"Last posted article URL: {last_posted_url}")
                 logger.info("Fetching new articles since last post...")
-                articles = self.scraper.fetch_new_articles_since_last_post(last_posted_url)
+                articles = self.scraper.fetch_new_articles_since_last_post(last_posted_url, posted_urls)
             else:
                 logger.info("No previous posts found. Fetching all articles from sitemap...")
                 articles = self.scraper.fetch_articles_from_sitemap()
@@ -70,100 +76,121 @@ class NewsPublisher:
             
             logger.info(f"Found {len(articles)} new articles to process")
             
-            # Step 3: Process each article
+            # Step 3: Process new articles concurrently
+            log_debug = logger.debug
+            new_articles = []
+            append_new = new_articles.append
+            for article in articles:
+                if article['url'] in posted_urls:
+                    log_debug("Article already posted: %s", article['title'])
+                else:
+                    append_new(article)
+            
+            # Start every page fetch up front; publishing consumes them in order as they finish
+            scrapes = [self.scraper.scrape_article_async(article['url'], article.get('lastmod')) for article in new_articles]
+            
+            store = self.db.bulk_store_posted_articles
+            append_pending = pending_docs.append
             published_count = 0
-            for i,article in enumerate(articles):
-                # if i == 1:
-                #     break
-                try:
-                    # Check if article already posted
-                    if self.db.is_article_posted(article['url']):
-                        try:
-                            logger.info(f"Article already posted: {article['title']}")
-                        except UnicodeEncodeError:
-                            safe_title = article['title'].encode('ascii', 'replace').decode('ascii')
-                            logger.info(f"Article already posted: {safe_title}")
-                        continue
-                    
-                    # Scrape article details
-                    try:
-                        logger.info(f"Scraping article: {article['title']}")
-                    except UnicodeEncodeError:
-                        safe_title = article['title'].encode('ascii', 'replace').decode('ascii')
-                        logger.info(f"Scraping article: {safe_title}")
-                    article_details = self.scraper.scrape_article(article['url'])
-                    
-                    if not article_details:
-                        logger.warning(f"Failed to scrape article: {article['url']}")
+            with ThreadPoolExecutor(max_workers=PIPELINE_WORKERS, thread_name_prefix='pipeline') as executor:
+                for result in executor.map(self._process_one, new_articles, scrapes):
+                    if result is None:
                         continue
                     
-                    # Publish to Blogger
-                    try:
-                        logger.info(f"Publishing to Blogger: {article_details['title']}")
-                    except UnicodeEncodeError:
-                        safe_title = article_details['title'].encode('ascii', 'replace').decode('ascii')
-                        logger.info(f"Publishing to Blogger: {safe_title}")
-                    blogger_post = self.blogger.publish_post(article_details)
-                    
-                    if not blogger_post:
-                        try:
-                            logger.error(f"Failed to publish to Blogger: {article_details['title']}")
-                        except UnicodeEncodeError:
-                            safe_title = article_details['title'].encode('ascii', 'replace').decode('ascii')
-                            logger.error(f"Failed to publish to Blogger: {safe_title}")
+                    # Telegram posts run in the background while later articles publish
+                    article_doc, telegram_post = result
+                    if not telegram_post.result():
+                        logger.error(f"Failed to post to Telegram: {article_doc['title']}")
                         continue
                     
-                    # Post to Telegram
-                    try:
-                        logger.info(f"Posting to Telegram: {article_details['title']}")
-                    except UnicodeEncodeError:
-                        safe_title = article_details['title'].encode('ascii', 'replace').decode('ascii')
-                        logger.info(f"Posting to Telegram: {safe_title}")
-                    telegram_success = self.telegram_bot.post_article(
-                        title=article_details['title'],
-                        content=article_details['content'],
-                        blogger_url=blogger_post['url'],
-                        image_url=article_details.get('image_url')
-                    )
-                    
-                    if telegram_success:
-                        # Store in database
-                        self.db.store_posted_article(
-                            url=article['url'],
-                            title=article_details['title'],
-                            blogger_id=blogger_post['id'],
-                            posted_at=datetime.now()
-                        )
-                        published_count += 1
-                        # Safe logging with Unicode handling
-                        try:
-                            logger.info(f"Successfully published: {article_details['title']}")
-                        except UnicodeEncodeError:
-                            # Fallback for console that doesn't support Unicode
-                            safe_title = article_details['title'].encode('ascii', 'replace').decode('ascii')
-                            logger.info(f"Successfully published: {safe_title}")
-                    else:
-                        try:
-                            logger.error(f"Failed to post to Telegram: {article_details['title']}")
-                        except UnicodeEncodeError:
-                            safe_title = article_details['title'].encode('ascii', 'replace').decode('ascii')
-                            logger.error(f"Failed to post to Telegram: {safe_title}")
-                        
-                except Exception as e:
-                    logger.error(f"Error processing article {article.get('url', 'unknown')}: {str(e)}")
-                    continue
+                    # Queue for storing in database
+                    append_pending(article_doc)
+                    if len(pending_docs) >= STORE_BATCH_SIZE:
+                        store(pending_docs)
+                        pending_docs.clear()
+                    published_count += 1
             
             logger.info(f"Pipeline completed. Published {published_count} articles")
             
         except Exception as e:
             logger.error(f"Pipeline failed: {str(e)}")
             raise
+        finally:
+            # Record whatever was published even if the run is cut short
+            if pending_docs:
+                self.db.bulk_store_posted_articles(pending_docs)
+    
+    def _process_one(self, article: Dict[str, Any], scrape: Future) -> Optional[Tuple[Dict[str, Any], Future]]:
+        """
+        Publish and announce a single article once its scrape has finished
+        Returns the database document to store with the pending Telegram post,
+        or None if scraping or publishing failed
+        """
+        log_debug = logger.debug
+        log_error = logger.error
+        url = article['url']
+        try:
+            # Wait for the scraped article details
+            log_debug("Waiting for scraped article: %s", article['title'])
+            article_details = scrape.result()
+            
+            if not article_details:
+                logger.warning(f"Failed to scrape article: {url}")
+                return None
+            
+            title = article_details['title']
+            
+            # Publish to Blogger
+            log_debug("Publishing to Blogger: %s", title)
+            blogger_post = self.blogger.publish_post(article_details)
+            
+            if not blogger_post:
+                log_error(f"Failed to publish to Blogger: {title}")
+                return None
+            
+            blogger_url = blogger_post['url']
+            
+            # Post to Telegram without waiting for it to finish
+            log_debug("Posting to Telegram: %s", title)
+            telegram_post = self.telegram_bot.post_article_async(
+                title=title,
+                content=article_details['content'],
+                blogger_url=blogger_url,
+                image_url=article_details.get('image_url')
+            )
+            
+            logger.info("Published %s → %s", title, blogger_url)
+            article_doc = self.db.build_article_doc(
+                url=url,
+                title=title,
+                blogger_id=blogger_post['id'],
+                posted_at=datetime.now(UTC)
+            )
+            return article_doc, telegram_post
+            
+        except Exception as e:
+            log_error(f"Error processing article {url}: {str(e)}")
+            return None
+
+
+# Process-wide publisher, so repeated runs reuse the authenticated clients
+_publisher = None
+_publisher_lock = threading.Lock()
+
+
+def get_news_publisher() -> NewsPublisher:
+    """Return the shared NewsPublisher instance, creating it on first use"""
+    global _publisher
+    with _publisher_lock:
+        if _publisher is None:
+            _publisher = NewsPublisher()
+        return _publisher
 
 
 def main():
     """Main entry point"""
     try:
-        publisher = NewsPublisher()
+        publisher = get_news_publisher()
         publisher.run_pipeline()
     except Exception as e:
         logger.error(f"Application failed: {str(e)}")
@@ -4,32 +4,439 @@ Article scraper for Tamil Cinema News
 Handles sitemap parsing and article content extraction
 """
 
+import functools
+import itertools
 import logging
+import os
 import re
+import sqlite3
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Comment
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Set
 import time
-import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Connections kept open per host, enough for the pipeline's concurrent article fetches
+HTTP_POOL_MAXSIZE = 32
+
+# Maximum article pages fetched and parsed at the same time
+SCRAPE_CONCURRENCY = 8
+
+# Spacing between requests to the site, widened when it answers 429 and narrowed again on success
+MIN_REQUEST_INTERVAL = 0.2
+MAX_REQUEST_INTERVAL = 30.0
+
+# Times a request is repeated after a 429 before giving up
+RATE_LIMIT_RETRIES = 3
+
+# Article pages are streamed and cut off after this many (decoded) bytes
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# Sitemap URLs remembered by the URL title/slug helpers
+URL_CACHE_SIZE = 4096
+
+# Title and content candidates, in priority order. Each is a tag name, a .class or
+# an h1.class, all resolved by the single pass in ArticleScraper._scan_page
+TITLE_LANDMARKS = (
+    'h1.entry-title',
+    'h1.post-title',
+    'h1.article-title',
+    'h1',
+    '.entry-title',
+    '.post-title',
+    '.article-title',
+    'title'
+)
+
+CONTENT_LANDMARKS = (
+    '.ds-content',
+    '.entry-content',
+    '.post-content',
+    '.article-content',
+    '.content',
+    'article',
+    '.post-body',
+    '.entry-body'
+)
+
+# Tag names and classes recorded by the page scan
+LANDMARK_TAGS = frozenset(['h1', 'title', 'article'])
+LANDMARK_CLASSES = frozenset([
+    'entry-title', 'post-title', 'article-title',
+    'ds-content', 'entry-content', 'post-content', 'article-content',
+    'content', 'post-body', 'entry-body', 'ds-topics'
+])
+
+# Common tag selectors for different website structures, combined into one selector list
+TAG_LINK_SELECTOR = soupsieve.compile(', '.join([
+    '.tags a',           # Common pattern: <div class="tags"><a>tag1</a><a>tag2</a></div>
+    '.tag a',            # Alternative: <div class="tag"><a>tag1</a><a>tag2</a></div>
+    '.post-tags a',      # WordPress style: <div class="post-tags"><a>tag1</a></div>
+    '.entry-tags a',     # Another common pattern
+    '.article-tags a',   # Article-specific tags
+    '.meta-tags a',      # Meta tags section
+    '.tag-list a',       # Tag list pattern
+    'a[rel="tag"]',      # WordPress rel="tag" pattern
+    '.keywords a',       # Keywords section
+    '.categories a',     # Categories that might be used as tags
+    '.post-categories a', # Post categories
+    '.entry-categories a', # Entry categories
+]))
+
+# Meta tags whose content attribute lists tags
+TAG_META_SELECTORS = [soupsieve.compile(selector) for selector in (
+    'meta[name="keywords"]',  # Meta keywords tag
+    'meta[property="article:tag"]',  # Open Graph article tags
+    'meta[name="news_keywords"]',  # News keywords
+)]
+
+# Characters stripped from tag text (everything except word chars, spaces, hyphens)
+_TAG_CLEAN_RE = re.compile(r'[^\w\s\-]')
+
+# Class names that mark tag-like elements in the fallback search
+_TAG_CLASS_RE = re.compile(r'tag', re.I)
+
+# Separators used inside meta keyword lists
+_META_TAG_SPLIT_RE = re.compile(r'[,;|]')
+
+# A sentence runs up to ./!/? followed by whitespace (so decimals and URLs stay whole) or the end
+_SENTENCE_RE = re.compile(r'\S.*?(?:[.!?]+(?=\s|$)|$)', re.S)
+
+# Elements whose text is emitted as one content line
+TEXT_BLOCK_TAGS = frozenset(['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+# Descendants that make a text block be walked instead of flattened
+NESTED_CONTENT_TAGS = ['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote']
+
+# Per-image chunks of the article HTML
+_GALLERY_ITEM_HTML = '''
+                <div class="gallery-item">
+                    <img src="{img_url}" alt="{title} - Image {number}" loading="lazy" class="gallery-image">
+                </div>'''
+
+_INLINE_IMAGE_HTML = '''
+                <div class="inline-image-container">
+                    <img src="{img_url}" alt="{title} - Related Image" loading="lazy" class="inline-image">
+                </div>'''
+
+# Stylesheet block embedded in every published article (plain string, prepended as is)
+_ARTICLE_STYLE = '''<style>
+                    * {
+                        margin: 0;
+                        padding: 0;
+                        box-sizing: border-box;
+                    }
+                    
+                    body {
+                        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                        line-height: 1.6;
+                        color: #333;
+                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                        min-height: 100vh;
+                    }
+                    
+                    .article-container {
+                        max-width: 1200px;
+                        margin: 0 auto;
+                        background: white;
+                        box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+                        border-radius: 15px;
+                        overflow: hidden;
+                        margin-top: 20px;
+                        margin-bottom: 20px;
+                    }
+                    
+                    .article-header {
+                        background: linear-gradient(135deg, #ff6b6b, #ee5a24);
+                        color: white;
+                        padding: 40px 30px;
+                        text-align: center;
+                        position: relative;
+                        overflow: hidden;
+                    }
+                    
+                    .article-header::before {
+                        content: '';
+                        position: absolute;
+                        top: -50%;
+                        left: -50%;
+                        width: 200%;
+                        height: 200%;
+                        background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
+                        animation: float 6s ease-in-out infinite;
+                    }
+                    
+                    @keyframes float {
+                        0%, 100% { transform: translateY(0px) rotate(0deg); }
+                        50% { transform: translateY(-20px) rotate(180deg); }
+                    }
+                    
+                    .article-title {
+                        font-size: 2.5rem;
+                        font-weight: 700;
+                        margin-bottom: 15px;
+                        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+                        position: relative;
+                        z-index: 1;
+                    }
+                    
+                    .article-meta {
+                        font-size: 1rem;
+                        opacity: 0.9;
+                        position: relative;
+                        z-index: 1;
+                    }
+                    
+                    .article-content {
+                        padding: 40px 30px;
+                    }
+                    
+                    .image-gallery {
+                        display: grid;
+                        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+                        gap: 20px;
+                        margin: 30px 0;
+                        padding: 20px;
+                        background: #f8f9fa;
+                        border-radius: 10px;
+                    }
+                    
+                    .gallery-item {
+                        position: relative;
+                        overflow: hidden;
+                        border-radius: 10px;
+                        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+                        transition: transform 0.3s ease;
+                    }
+                    
+                    .gallery-item:hover {
+                        transform: translateY(-5px);
+                    }
+                    
+                    .gallery-image {
+                        width: 100%;
+                        height: 250px;
+                        object-fit: cover;
+                        transition: transform 0.3s ease;
+                    }
+                    
+                    .gallery-item:hover .gallery-image {
+                        transform: scale(1.05);
+                    }
+                    
+                    .inline-image-container {
+                        text-align: center;
+                        margin: 30px 0;
+                        padding: 20px;
+                        background: #f8f9fa;
+                        border-radius: 10px;
+                    }
+                    
+                    .inline-image {
+                        max-width: 100%;
+                        height: auto;
+                        border-radius: 10px;
+                        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+                    }
+                    
+                    .content-paragraph {
+                        font-size: 1.1rem;
+                        margin-bottom: 20px;
+                        text-align: justify;
+                        color: #444;
+                    }
+                    
+                    .content-paragraph:first-of-type {
+                        font-size: 1.2rem;
+                        font-weight: 500;
+                        color: #2c3e50;
+                    }
+                    
+                    .article-tags {
+                        margin-top: 30px;
+                        padding: 20px;
+                        background: #f8f9fa;
+                        border-radius: 10px;
+                        border-left: 4px solid #3498db;
+                    }
+                    
+                    .article-tags h3 {
+                        margin-bottom: 15px;
+                        color: #2c3e50;
+                        font-size: 1.1rem;
+                    }
+                    
+                    .tag-list {
+                        display: flex;
+                        flex-wrap: wrap;
+                        gap: 8px;
+                    }
+                    
+                    .tag {
+                        display: inline-block;
+                        padding: 6px 12px;
+                        background: #3498db;
+                        color: white;
+                        border-radius: 20px;
+                        font-size: 0.9rem;
+                        font-weight: 500;
+                        text-decoration: none;
+                        transition: background 0.3s ease;
+                    }
+                    
+                    .tag:hover {
+                        background: #2980b9;
+                    }
+                    
+                    .article-footer {
+                        background: #2c3e50;
+                        color: white;
+                        padding: 30px;
+                        text-align: center;
+                    }
+                    
+                    .source-link {
+                        color: #3498db;
+                        text-decoration: none;
+                        font-weight: 500;
+                        transition: color 0.3s ease;
+                    }
+                    
+                    .source-link:hover {
+                        color: #2980b9;
+                    }
+                    
+                    .social-share {
+                        margin-top: 20px;
+                    }
+                    
+                    .share-button {
+                        display: inline-block;
+                        padding: 10px 20px;
+                        margin: 5px;
+                        background: #3498db;
+                        color: white;
+                        text-decoration: none;
+                        border-radius: 25px;
+                        transition: background 0.3s ease;
+                    }
+                    
+                    .share-button:hover {
+                        background: #2980b9;
+                    }
+                    
+                    @media (max-width: 768px) {
+                        .article-title {
+                            font-size: 2rem;
+                        }
+                        
+                        .article-content {
+                            padding: 20px 15px;
+                        }
+                        
+                        .image-gallery {
+                            grid-template-columns: 1fr;
+                            padding: 15px;
+                        }
+                    }
+                </style>'''
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _extract_title_from_url(url: str) -> str:
+    """Extract a basic title from URL"""
+    # Remove domain and clean up URL to create a basic title
+    parsed = urlparse(url)
+    path = parsed.path.strip('/')
+    title = path.replace('-', ' ').replace('/', ' ').title()
+    return title[:100]  # Limit length
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _extract_slug_from_url(url: str) -> str:
+    """Extract slug from Cineulagam URL"""
+    try:
+        parsed = urlparse(url)
+        path = parsed.path.strip('/')
+        
+        # Remove 'article/' prefix if present
+        if path.startswith('article/'):
+            path = path[8:]  # Remove 'article/'
+        
+        # Remove the numeric ID at the end (last part after last dash)
+        parts = path.split('-')
+        if parts and parts[-1].isdigit():
+            # Remove the last part if it's numeric
+            parts = parts[:-1]
+        
+        # Join back with dashes to create slug
+        slug = '-'.join(parts)
+        return slug
+    except Exception as e:
+        logger.warning(f"Could not extract slug from URL {url}: {str(e)}")
+        return ""
+
 
 class ArticleScraper:
     """Scraper class for fetching and processing articles"""
     
-    def __init__(self):
-        """Initialize the scraper with headers and session"""
+    def __init__(self, keep_original: bool = False, cache_file: Optional[str] = None):
+        """
+        Initialize the scraper with headers and session
+        keep_original adds the unsummarized text to scraped articles as 'original_content'
+        cache_file is the SQLite file caching scraped articles between runs
+        (defaults to SCRAPE_CACHE_FILE, an empty value disables the cache)
+        """
+        self.keep_original = keep_original
+        self.cache_file = cache_file if cache_file is not None else os.getenv('SCRAPE_CACHE_FILE', 'scrape_cache.sqlite3')
+        self._cache_db = None
+        self._cache_lock = threading.Lock()
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,  # Includes br/zstd when their decoders are installed
             'Connection': 'keep-alive',
         })
         
+        # Reuse warm connections to the two cineulagam hosts and retry transient failures
+        # (429s are left to the rate limiter below)
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Last parsed sitemap and its validators for conditional requests
+        self._sitemap_articles = None
+        self._sitemap_etag = None
+        self._sitemap_last_modified = None
+        
+        # Adaptive request spacing shared by all scraper threads
+        self._request_interval = MIN_REQUEST_INTERVAL
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
+        
+        # Worker pool for scrape_article_async, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
     def fetch_articles_from_sitemap(self) -> List[Dict[str, str]]:
         """
         Fetch article URLs from the sitemap
@@ -39,39 +446,70 @@ class ArticleScraper:
         
         try:
             logger.info(f"Fetching sitemap from: {sitemap_url}")
-            response = self.session.get(sitemap_url, timeout=30)
-            response.raise_for_status()
-            
-            # Parse XML sitemap
-            soup = BeautifulSoup(response.content, 'xml')
-            articles = []
+            headers = {}
+            if self._sitemap_articles is not None:
+                if self._sitemap_etag:
+                    headers['If-None-Match'] = self._sitemap_etag
+                if self._sitemap_last_modified:
+                    headers['If-Modified-Since'] = self._sitemap_last_modified
             
-            # Extract URLs and titles from sitemap
-            for url_tag in soup.find_all('url'):
-                loc = url_tag.find('loc')
-                lastmod = url_tag.find('lastmod')
+            with self._rate_limited_get(sitemap_url, headers=headers, timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"Sitemap not modified, reusing {len(self._sitemap_articles)} cached articles")
+                    return list(self._sitemap_articles)
                 
-                if loc:
-                    article_url = loc.text.strip()
-                    # Extract title from URL or use a placeholder
-                    title = self._extract_title_from_url(article_url)
-                    
-                    articles.append({
-                        'url': article_url,
-                        'title': title,
-                        'lastmod': lastmod.text.strip() if lastmod else None
-                    })
+                response.raise_for_status()
+                
+                # Parse straight off the socket so entries are handled while the body downloads
+                response.raw.decode_content = True
+                articles = self._parse_sitemap(response.raw)
+            
+            self._sitemap_articles = articles
+            self._sitemap_etag = response.headers.get('ETag')
+            self._sitemap_last_modified = response.headers.get('Last-Modified')
             
             logger.info(f"Found {len(articles)} articles in sitemap")
-            return articles
+            return list(articles)
             
         except Exception as e:
             logger.error(f"Error fetching sitemap: {str(e)}")
             return []
     
-    def fetch_new_articles_since_last_post(self, last_posted_url: str) -> List[Dict[str, str]]:
+    def _parse_sitemap(self, stream) -> List[Dict[str, str]]:
+        """
+        Stream an XML sitemap, handling each <url> entry as it closes
+        Returns list of article dictionaries with url, title and lastmod
+        """
+        articles = []
+        context = etree.iterparse(stream, events=('end',), tag='{*}url')
+        
+        # Extract URLs and titles from sitemap
+        for _, url_elem in context:
+            loc = url_elem.findtext('{*}loc')
+            lastmod = url_elem.findtext('{*}lastmod')
+            
+            if loc and loc.strip():
+                article_url = loc.strip()
+                # Extract title from URL or use a placeholder
+                title = _extract_title_from_url(article_url)
+                
+                articles.append({
+                    'url': article_url,
+                    'title': title,
+                    'lastmod': lastmod.strip() if lastmod else None
+                })
+            
+            # Free the parsed entry and any earlier siblings to keep memory flat
+            url_elem.clear()
+            while url_elem.getprevious() is not None:
+                del url_elem.getparent()[0]
+        
+        return articles
+    
+    def fetch_new_articles_since_last_post(self, last_posted_url: str, posted_urls: Optional[Set[str]] = None) -> List[Dict[str, str]]:
         """
         Fetch only new articles since the last posted article
+        Articles whose URL is in posted_urls are skipped
         Returns list of new article dictionaries with url and title
         """
         try:
@@ -82,21 +520,24 @@ class ArticleScraper:
                 logger.warning("No articles found in sitemap")
                 return []
             
-            # Find the index of the last posted article
-            last_posted_index = -1
+            # Find the index of the last posted article (first occurrence wins)
+            url_index = {}
             for i, article in enumerate(all_articles):
-                if article['url'] == last_posted_url:
-                    last_posted_index = i
-                    break
+                url_index.setdefault(article['url'], i)
+            last_posted_index = url_index.get(last_posted_url, -1)
             
             if last_posted_index == -1:
                 # Last posted article not found in sitemap, return all articles
                 logger.warning(f"Last posted article not found in sitemap: {last_posted_url}")
                 logger.info("Processing all articles from sitemap")
-                return all_articles
+                new_articles = all_articles
+            else:
+                # Return only articles after the last posted one
+                new_articles = all_articles[:last_posted_index]  # Articles before the last posted one
+            
+            if posted_urls:
+                new_articles = [article for article in new_articles if article['url'] not in posted_urls]
             
-            # Return only articles after the last posted one
-            new_articles = all_articles[:last_posted_index]  # Articles before the last posted one
             logger.info(f"Found {len(new_articles)} new articles since last post")
             return new_articles
             
@@ -104,132 +545,238 @@ class ArticleScraper:
             logger.error(f"Error fetching new articles: {str(e)}")
             return []
     
-    def scrape_article(self, url: str) -> Optional[Dict[str, str]]:
+    def scrape_article(self, url: str, lastmod: Optional[str] = None) -> Optional[Dict[str, str]]:
         """
         Scrape individual article content
+        A cached result for the same url and sitemap lastmod is reused without fetching
         Returns article details including title, content, and image
         """
+        cached = self._cache_get(url, lastmod)
+        if cached is not None:
+            logger.info(f"Using cached article: {url}")
+            return cached
+        
         try:
             logger.info(f"Scraping article: {url}")
             
-            # Add random delay to avoid being blocked
-            time.sleep(random.uniform(1, 3))
+            with self._rate_limited_get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                body = self._read_capped(response, url)
             
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+            soup = BeautifulSoup(body, 'lxml')
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Locate title/content/topics candidates in one pass over the page
+            landmarks = self._scan_page(soup)
             
             # Extract title
-            title = self._extract_title(soup)
+            title = self._extract_title(soup, landmarks)
             if not title:
                 logger.warning(f"Could not extract title from: {url}")
                 return None
 
             # Extract content
-            content = self._extract_content(soup)
+            content = self._extract_content(soup, landmarks)
             if not content:
                 logger.warning(f"Could not extract content from: {url}")
                 return None
             
             # Extract images
-            image_urls = self._extract_images(soup, url)
+            image_urls = self._extract_images(soup, url, landmarks.get('.ds-content'))
             
             # Extract tags
-            tags = self._extract_tags(soup)
+            tags = self._extract_tags(soup, landmarks)
             
             # Extract slug from URL
-            slug = self._extract_slug_from_url(url)
+            slug = _extract_slug_from_url(url)
             
             # Summarize/rewrite content to avoid copyright issues
             summarized_content = self._summarize_content(content)
             
             html_content = self.make_html_content(title, content, image_urls, url, tags)
-            return {
+            article = {
                 'url': url,
                 'title': title,
                 'content': summarized_content,
-                'original_content': content,
                 'image_urls': image_urls,
                 'image_url': image_urls[0] if image_urls else None,  # Keep backward compatibility
                 'tags': tags,
                 'slug': slug,
                 'html_content': html_content
             }
+            if self.keep_original:
+                article['original_content'] = content
+            
+            self._cache_put(url, lastmod, article)
+            return article
             
         except Exception as e:
             logger.error(f"Error scraping article {url}: {str(e)}")
             return None
     
+    def _rate_limited_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET url through the shared rate limiter, backing off and retrying on HTTP 429
+        Returns the last response (which may still be a 429)
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            # Reserve the next free request slot, then wait for it outside the lock
+            with self._rate_lock:
+                now = time.monotonic()
+                slot = max(now, self._next_request_at)
+                self._next_request_at = slot + self._request_interval
+            if slot > now:
+                time.sleep(slot - now)
+            
+            response = self.session.get(url, **kwargs)
+            
+            with self._rate_lock:
+                if response.status_code == 429:
+                    response.close()
+                    self._request_interval = min(self._request_interval * 2, MAX_REQUEST_INTERVAL)
+                    delay = self._retry_after_seconds(response.headers.get('Retry-After'))
+                    self._next_request_at = max(self._next_request_at, time.monotonic() + max(delay, self._request_interval))
+                else:
+                    self._request_interval = max(self._request_interval / 2, MIN_REQUEST_INTERVAL)
+                    return response
+            
+            logger.warning(f"Rate limited by server, backing off (attempt {attempt + 1}): {url}")
+        
+        return response
+    
+    @staticmethod
+    def _read_capped(response: requests.Response, url: str) -> bytes:
+        """Read a streamed response body, stopping after MAX_PAGE_BYTES"""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                logger.warning(f"Page larger than {MAX_PAGE_BYTES} bytes, truncating: {url}")
+                break
+        return b''.join(chunks)[:MAX_PAGE_BYTES]
+    
+    @staticmethod
+    def _retry_after_seconds(retry_after: Optional[str]) -> float:
+        """Parse a Retry-After header (seconds or HTTP date) into seconds, 0 if absent or invalid"""
+        if not retry_after:
+            return 0.0
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+            return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        except (TypeError, ValueError):
+            return 0.0
+    
+    def scrape_article_async(self, url: str, lastmod: Optional[str] = None) -> Future:
+        """
+        Schedule scrape_article on the scraper's bounded worker pool
+        Returns a Future resolving to the same result as scrape_article
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=SCRAPE_CONCURRENCY, thread_name_prefix='scraper')
+        return self._executor.submit(self.scrape_article, url, lastmod)
+    
+    def _get_cache_db(self) -> Optional[sqlite3.Connection]:
+        """Open the scrape cache on first use; caller holds _cache_lock"""
+        if self._cache_db is None and self.cache_file:
+            try:
+                self._cache_db = sqlite3.connect(self.cache_file, check_same_thread=False)
+                self._cache_db.execute(
+                    'CREATE TABLE IF NOT EXISTS articles (url TEXT PRIMARY KEY, lastmod TEXT, article BLOB)'
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Scrape cache disabled, could not open {self.cache_file}: {str(e)}")
+                self.cache_file = None
+                self._cache_db = None
+        return self._cache_db
+    
+    def _cache_get(self, url: str, lastmod: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached article for url if it was scraped at the same lastmod"""
+        with self._cache_lock:
+            db = self._get_cache_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute('SELECT lastmod, article FROM articles WHERE url = ?', (url,)).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"Error reading scrape cache: {str(e)}")
+                return None
+        
+        if row is None or row[0] != lastmod:
+            return None
+        return orjson.loads(row[1])
+    
+    def _cache_put(self, url: str, lastmod: Optional[str], article: Dict[str, Any]):
+        """Store a scraped article in the cache"""
+        with self._cache_lock:
+            db = self._get_cache_db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        'INSERT OR REPLACE INTO articles (url, lastmod, article) VALUES (?, ?, ?)',
+                        (url, lastmod, orjson.dumps(article))
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Error writing scrape cache: {str(e)}")
+    
     def _extract_title_from_url(self, url: str) -> str:
         """Extract a basic title from URL"""
-        # Remove domain and clean up URL to create a basic title
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-        title = path.replace('-', ' ').replace('/', ' ').title()
-        return title[:100]  # Limit length
+        return _extract_title_from_url(url)
     
     def _extract_slug_from_url(self, url: str) -> str:
         """Extract slug from Cineulagam URL"""
-        try:
-            parsed = urlparse(url)
-            path = parsed.path.strip('/')
-            
-            # Remove 'article/' prefix if present
-            if path.startswith('article/'):
-                path = path[8:]  # Remove 'article/'
-            
-            # Remove the numeric ID at the end (last part after last dash)
-            parts = path.split('-')
-            if parts and parts[-1].isdigit():
-                # Remove the last part if it's numeric
-                parts = parts[:-1]
-            
-            # Join back with dashes to create slug
-            slug = '-'.join(parts)
-            return slug
-        except Exception as e:
-            logger.warning(f"Could not extract slug from URL {url}: {str(e)}")
-            return ""
+        return _extract_slug_from_url(url)
+    
+    def _scan_page(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Walk the page once, recording the first element for each landmark
+        Keys are tag names, '.class' and 'h1.class' (see TITLE_LANDMARKS/CONTENT_LANDMARKS)
+        """
+        landmarks = {}
+        setdefault = landmarks.setdefault
+        for element in soup.find_all(True):
+            name = element.name
+            if name in LANDMARK_TAGS:
+                setdefault(name, element)
+            classes = element.get('class')
+            if classes:
+                for class_name in classes:
+                    if class_name in LANDMARK_CLASSES:
+                        setdefault('.' + class_name, element)
+                        if name == 'h1':
+                            setdefault('h1.' + class_name, element)
+        return landmarks
     
-    def _extract_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_title(self, soup: BeautifulSoup, landmarks: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Extract article title from HTML"""
+        if landmarks is None:
+            landmarks = self._scan_page(soup)
+        
         # Try multiple selectors for title
-        title_selectors = [
-            'h1.entry-title',
-            'h1.post-title',
-            'h1.article-title',
-            'h1',
-            '.entry-title',
-            '.post-title',
-            '.article-title',
-            'title'
-        ]
-        
-        for selector in title_selectors:
-            title_elem = soup.select_one(selector)
+        for key in TITLE_LANDMARKS:
+            title_elem = landmarks.get(key)
             if title_elem and title_elem.get_text().strip():
                 return title_elem.get_text().strip()
         
         return None
     
-    def _extract_content(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_content(self, soup: BeautifulSoup, landmarks: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Extract article content from HTML"""
+        if landmarks is None:
+            landmarks = self._scan_page(soup)
+        
         # Try multiple selectors for content
-        content_selectors = [
-            '.ds-content',
-            '.entry-content',
-            '.post-content',
-            '.article-content',
-            '.content',
-            'article',
-            '.post-body',
-            '.entry-body'
-        ]
-        
-        for selector in content_selectors:
-            content_elem = soup.select_one(selector)
-            if content_elem:
+        for key in CONTENT_LANDMARKS:
+            content_elem = landmarks.get(key)
+            # Skip candidates removed while cleaning an earlier one
+            if content_elem and not content_elem.decomposed:
                 # Remove script and style elements
                 for script in content_elem(["script", "style"]):
                     script.decompose()
@@ -251,29 +798,45 @@ class ArticleScraper:
         and converting other elements to text
         """
         content_parts = []
+        self._collect_content_parts(content_elem, content_parts)
         
-        for element in content_elem.find_all():
-            print(element.name)
-            if element.name == 'blockquote':
-                print("iframe found................")
-                # Preserve iframe as HTML
-                iframe_html = str(element)
-                content_parts.append(iframe_html)
-            elif element.name in ['p', 'div', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
+        # Join all parts with newlines
+        return '\n'.join(content_parts)
+    
+    def _collect_content_parts(self, element, content_parts: List[str]):
+        """
+        Walk element's children once in document order, appending text and embeds
+        Each block's text is emitted once, by the innermost block that holds it
+        """
+        for child in element.children:
+            name = child.name
+            if name is None:
+                # Loose text directly inside a container
+                if not isinstance(child, Comment):
+                    text_content = child.strip()
+                    if text_content:
+                        content_parts.append(text_content)
+            elif name == 'blockquote':
+                # Preserve embeds (tweets, instagram posts) as HTML
+                content_parts.append(str(child))
+            elif name == 'br':
+                # Preserve line breaks
+                content_parts.append('\n')
+            elif name in TEXT_BLOCK_TAGS and child.find(NESTED_CONTENT_TAGS) is None:
                 # For text elements, get the text content
-                text_content = element.get_text(strip=True)
+                text_content = child.get_text(strip=True)
                 if text_content:
                     content_parts.append(text_content)
-            elif element.name == 'br':
-                # Preserve line breaks
-                content_parts.append('\n')
-        
-        # Join all parts with newlines
-        return '\n'.join(content_parts)
+            else:
+                self._collect_content_parts(child, content_parts)
     
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract all images from article, prioritizing .img-fluid in .ds-content"""
+    def _extract_images(self, soup: BeautifulSoup, base_url: str, ds_content=None) -> List[str]:
+        """
+        Extract all images from article, prioritizing .img-fluid in .ds-content
+        ds_content is the already resolved .ds-content element, if any
+        """
         images = []
+        seen_images = set()
         
         def normalize_url(img_src: str) -> str:
             """Convert relative URLs to absolute"""
@@ -286,109 +849,88 @@ class ArticleScraper:
             return img_src
         
         # 1. Try to find all images with class "img-fluid" within ".ds-content"
-        ds_content = soup.select_one('.ds-content')
+        img_srcs = []
         if ds_content:
-            # Find all img-fluid images in ds-content
-            img_elems = ds_content.find_all('img', class_='img-fluid')
-            for img_elem in img_elems:
-                if img_elem.get('src'):
-                    img_src = normalize_url(img_elem.get('src'))
-                    if img_src not in images:  # Avoid duplicates
-                        images.append(img_src)
-            
-            # If no img-fluid found, try any <img> in ds-content
-            if not images:
-                img_elems = ds_content.find_all('img')
-                for img_elem in img_elems:
-                    if img_elem.get('src'):
-                        img_src = normalize_url(img_elem.get('src'))
-                        if img_src not in images:  # Avoid duplicates
-                            images.append(img_src)
+            # One pass over the <img> tags that have a src, noting which are img-fluid
+            fluid_srcs = []
+            for img_elem in ds_content.find_all('img', src=True):
+                img_src = img_elem['src']
+                if img_src:
+                    img_srcs.append(img_src)
+                    if 'img-fluid' in img_elem.get('class', ()):
+                        fluid_srcs.append(img_src)
+            
+            # If no img-fluid found, use any <img> in ds-content
+            img_srcs = fluid_srcs or img_srcs
 
         # 2. If no images found in ds-content, try to find any image with class "img-fluid" in the whole document
-        if not images:
-            img_elems = soup.find_all('img', class_='img-fluid')
-            for img_elem in img_elems:
-                if img_elem.get('src'):
-                    img_src = normalize_url(img_elem.get('src'))
-                    if img_src not in images:  # Avoid duplicates
-                        images.append(img_src)
+        if not img_srcs:
+            img_srcs = [img_elem['src'] for img_elem in soup.find_all('img', class_='img-fluid', src=True) if img_elem['src']]
+        
+        for img_src in img_srcs:
+            img_src = normalize_url(img_src)
+            if img_src not in seen_images:  # Avoid duplicates
+                seen_images.add(img_src)
+                images.append(img_src)
     
         return images
     
-    def _extract_tags(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_tags(self, soup: BeautifulSoup, landmarks: Optional[Dict[str, Any]] = None) -> List[str]:
         """Extract tags from article HTML"""
         tags = []
+        seen_tags = set()
         
         # First, try the specific ds-topics structure for this website
-        ds_topics = soup.select_one('.ds-topics')
+        ds_topics = landmarks.get('.ds-topics') if landmarks is not None else soup.find(class_='ds-topics')
         if ds_topics:
             tag_links = ds_topics.find_all('a')
             for link in tag_links:
                 tag_text = link.get_text().strip()
                 if tag_text and len(tag_text) > 1:
                     # Clean up the tag text
-                    tag_text = re.sub(r'[^\w\s\-]', '', tag_text).strip()
-                    if tag_text and tag_text not in tags:
+                    tag_text = _TAG_CLEAN_RE.sub('', tag_text).strip()
+                    if tag_text and tag_text not in seen_tags:
+                        seen_tags.add(tag_text)
                         tags.append(tag_text)
             
             if tags:
                 logger.info(f"Found {len(tags)} tags from .ds-topics: {tags}")
                 return tags[:10]  # Return early if we found tags from ds-topics
         
-        # Common tag selectors for different website structures
-        tag_selectors = [
-            '.tags a',           # Common pattern: <div class="tags"><a>tag1</a><a>tag2</a></div>
-            '.tag a',            # Alternative: <div class="tag"><a>tag1</a><a>tag2</a></div>
-            '.post-tags a',      # WordPress style: <div class="post-tags"><a>tag1</a></div>
-            '.entry-tags a',     # Another common pattern
-            '.article-tags a',   # Article-specific tags
-            '.meta-tags a',      # Meta tags section
-            '.tag-list a',       # Tag list pattern
-            'a[rel="tag"]',      # WordPress rel="tag" pattern
-            '.keywords a',       # Keywords section
-            '.categories a',     # Categories that might be used as tags
-            '.post-categories a', # Post categories
-            '.entry-categories a', # Entry categories
-            'meta[name="keywords"]', # Meta keywords tag
-            'meta[property="article:tag"]', # Open Graph article tags
-            'meta[name="news_keywords"]', # News keywords
-        ]
-        
-        # Try each selector
-        for selector in tag_selectors:
-            if selector.startswith('meta'):
-                # Handle meta tags differently
-                meta_elem = soup.select_one(selector)
-                if meta_elem and meta_elem.get('content'):
-                    content = meta_elem.get('content')
-                    # Split by common separators
-                    meta_tags = re.split(r'[,;|]', content)
-                    for tag in meta_tags:
-                        tag = tag.strip()
-                        if tag and len(tag) > 1 and tag not in tags:
-                            tags.append(tag)
-            else:
-                # Handle regular tag elements
-                tag_elements = soup.select(selector)
-                for elem in tag_elements:
-                    tag_text = elem.get_text().strip()
-                    if tag_text and len(tag_text) > 1 and tag_text not in tags:
-                        # Clean up tag text
-                        tag_text = re.sub(r'[^\w\s\-]', '', tag_text)  # Remove special chars except word chars, spaces, hyphens
-                        tag_text = tag_text.strip()
-                        if tag_text:
-                            tags.append(tag_text)
+        # Handle regular tag elements, all link-style selectors in one document-order pass
+        for elem in TAG_LINK_SELECTOR.select(soup):
+            tag_text = elem.get_text().strip()
+            if tag_text and len(tag_text) > 1 and tag_text not in seen_tags:
+                # Clean up tag text
+                tag_text = _TAG_CLEAN_RE.sub('', tag_text)  # Remove special chars except word chars, spaces, hyphens
+                tag_text = tag_text.strip()
+                if tag_text:
+                    seen_tags.add(tag_text)
+                    tags.append(tag_text)
+        
+        # Handle meta tags differently
+        for selector in TAG_META_SELECTORS:
+            meta_elem = selector.select_one(soup)
+            if meta_elem and meta_elem.get('content'):
+                content = meta_elem.get('content')
+                # Split by common separators
+                meta_tags = _META_TAG_SPLIT_RE.split(content)
+                for tag in meta_tags:
+                    tag = tag.strip()
+                    if tag and len(tag) > 1 and tag not in seen_tags:
+                        seen_tags.add(tag)
+                        tags.append(tag)
         
         # Additional fallback: look for any element with "tag" in class name
         if not tags:
-            tag_elements = soup.find_all(['a', 'span', 'div'], class_=re.compile(r'tag', re.I))
+            tag_elements = soup.find_all(['a', 'span', 'div'], class_=_TAG_CLASS_RE)
             for elem in tag_elements:
                 tag_text = elem.get_text().strip()
-                if tag_text and len(tag_text) > 1 and tag_text not in tags:
-                    tag_text = re.sub(r'[^\w\s\-]', '', tag_text)
+                if tag_text and len(tag_text) > 1 and tag_text not in seen_tags:
+                    tag_text = _TAG_CLEAN_RE.sub('', tag_text)
                     tag_text = tag_text.strip()
                     if tag_text:
+                        seen_tags.add(tag_text)
                         tags.append(tag_text)
         
         # Limit number of tags and clean them up
@@ -396,8 +938,11 @@ class ArticleScraper:
         
         # Clean up tags - remove very short ones and duplicates
         cleaned_tags = []
+        seen_lower = set()
         for tag in tags:
-            if len(tag) >= 2 and tag.lower() not in [t.lower() for t in cleaned_tags]:
+            tag_lower = tag.lower()
+            if len(tag) >= 2 and tag_lower not in seen_lower:
+                seen_lower.add(tag_lower)
                 cleaned_tags.append(tag)
         
         logger.info(f"Extracted {len(cleaned_tags)} tags: {cleaned_tags}")
@@ -439,247 +984,24 @@ class ArticleScraper:
         # Create image gallery HTML
         image_gallery = ""
         if image_urls:
-            image_gallery = '<div class="image-gallery">'
+            gallery_parts = ['<div class="image-gallery">']
             for i, img_url in enumerate(image_urls):
-                image_gallery += f'''
-                <div class="gallery-item">
-                    <img src="{img_url}" alt="{title} - Image {i+1}" loading="lazy" class="gallery-image">
-                </div>'''
-            image_gallery += '</div>'
+                gallery_parts.append(_GALLERY_ITEM_HTML.format(img_url=img_url, title=title, number=i + 1))
+            gallery_parts.append('</div>')
+            image_gallery = ''.join(gallery_parts)
         
         # Create structured content with images interspersed
-        structured_content = ""
+        content_parts = []
         for i, paragraph in enumerate(paragraphs):
-            structured_content += f'<p class="content-paragraph">{paragraph}</p>'
+            content_parts.append(f'<p class="content-paragraph">{paragraph}</p>')
             
             # Insert images between paragraphs for better visual flow
             if image_urls and i < len(image_urls) and i % 2 == 1:  # Insert every other paragraph
                 img_index = min(i // 2, len(image_urls) - 1)
-                structured_content += f'''
-                <div class="inline-image-container">
-                    <img src="{image_urls[img_index]}" alt="{title} - Related Image" loading="lazy" class="inline-image">
-                </div>'''
+                content_parts.append(_INLINE_IMAGE_HTML.format(img_url=image_urls[img_index], title=title))
+        structured_content = ''.join(content_parts)
         
-        html_content = f'''<style>
-                    * {{
-                        margin: 0;
-                        padding: 0;
-                        box-sizing: border-box;
-                    }}
-                    
-                    body {{
-                        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                        line-height: 1.6;
-                        color: #333;
-                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                        min-height: 100vh;
-                    }}
-                    
-                    .article-container {{
-                        max-width: 1200px;
-                        margin: 0 auto;
-                        background: white;
-                        box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-                        border-radius: 15px;
-                        overflow: hidden;
-                        margin-top: 20px;
-                        margin-bottom: 20px;
-                    }}
-                    
-                    .article-header {{
-                        background: linear-gradient(135deg, #ff6b6b, #ee5a24);
-                        color: white;
-                        padding: 40px 30px;
-                        text-align: center;
-                        position: relative;
-                        overflow: hidden;
-                    }}
-                    
-                    .article-header::before {{
-                        content: '';
-                        position: absolute;
-                        top: -50%;
-                        left: -50%;
-                        width: 200%;
-                        height: 200%;
-                        background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-                        animation: float 6s ease-in-out infinite;
-                    }}
-                    
-                    @keyframes float {{
-                        0%, 100% {{ transform: translateY(0px) rotate(0deg); }}
-                        50% {{ transform: translateY(-20px) rotate(180deg); }}
-                    }}
-                    
-                    .article-title {{
-                        font-size: 2.5rem;
-                        font-weight: 700;
-                        margin-bottom: 15px;
-                        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-                        position: relative;
-                        z-index: 1;
-                    }}
-                    
-                    .article-meta {{
-                        font-size: 1rem;
-                        opacity: 0.9;
-                        position: relative;
-                        z-index: 1;
-                    }}
-                    
-                    .article-content {{
-                        padding: 40px 30px;
-                    }}
-                    
-                    .image-gallery {{
-                        display: grid;
-                        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                        gap: 20px;
-                        margin: 30px 0;
-                        padding: 20px;
-                        background: #f8f9fa;
-                        border-radius: 10px;
-                    }}
-                    
-                    .gallery-item {{
-                        position: relative;
-                        overflow: hidden;
-                        border-radius: 10px;
-                        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-                        transition: transform 0.3s ease;
-                    }}
-                    
-                    .gallery-item:hover {{
-                        transform: translateY(-5px);
-                    }}
-                    
-                    .gallery-image {{
-                        width: 100%;
-                        height: 250px;
-                        object-fit: cover;
-                        transition: transform 0.3s ease;
-                    }}
-                    
-                    .gallery-item:hover .gallery-image {{
-                        transform: scale(1.05);
-                    }}
-                    
-                    .inline-image-container {{
-                        text-align: center;
-                        margin: 30px 0;
-                        padding: 20px;
-                        background: #f8f9fa;
-                        border-radius: 10px;
-                    }}
-                    
-                    .inline-image {{
-                        max-width: 100%;
-                        height: auto;
-                        border-radius: 10px;
-                        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
-                    }}
-                    
-                    .content-paragraph {{
-                        font-size: 1.1rem;
-                        margin-bottom: 20px;
-                        text-align: justify;
-                        color: #444;
-                    }}
-                    
-                    .content-paragraph:first-of-type {{
-                        font-size: 1.2rem;
-                        font-weight: 500;
-                        color: #2c3e50;
-                    }}
-                    
-                    .article-tags {{
-                        margin-top: 30px;
-                        padding: 20px;
-                        background: #f8f9fa;
-                        border-radius: 10px;
-                        border-left: 4px solid #3498db;
-                    }}
-                    
-                    .article-tags h3 {{
-                        margin-bottom: 15px;
-                        color: #2c3e50;
-                        font-size: 1.1rem;
-                    }}
-                    
-                    .tag-list {{
-                        display: flex;
-                        flex-wrap: wrap;
-                        gap: 8px;
-                    }}
-                    
-                    .tag {{
-                        display: inline-block;
-                        padding: 6px 12px;
-                        background: #3498db;
-                        color: white;
-                        border-radius: 20px;
-                        font-size: 0.9rem;
-                        font-weight: 500;
-                        text-decoration: none;
-                        transition: background 0.3s ease;
-                    }}
-                    
-                    .tag:hover {{
-                        background: #2980b9;
-                    }}
-                    
-                    .article-footer {{
-                        background: #2c3e50;
-                        color: white;
-                        padding: 30px;
-                        text-align: center;
-                    }}
-                    
-                    .source-link {{
-                        color: #3498db;
-                        text-decoration: none;
-                        font-weight: 500;
-                        transition: color 0.3s ease;
-                    }}
-                    
-                    .source-link:hover {{
-                        color: #2980b9;
-                    }}
-                    
-                    .social-share {{
-                        margin-top: 20px;
-                    }}
-                    
-                    .share-button {{
-                        display: inline-block;
-                        padding: 10px 20px;
-                        margin: 5px;
-                        background: #3498db;
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 25px;
-                        transition: background 0.3s ease;
-                    }}
-                    
-                    .share-button:hover {{
-                        background: #2980b9;
-                    }}
-                    
-                    @media (max-width: 768px) {{
-                        .article-title {{
-                            font-size: 2rem;
-                        }}
-                        
-                        .article-content {{
-                            padding: 20px 15px;
-                        }}
-                        
-                        .image-gallery {{
-                            grid-template-columns: 1fr;
-                            padding: 15px;
-                        }}
-                    }}
-                </style>
+        html_content = _ARTICLE_STYLE + f'''
                 <body>
                     <div class="article-container">
                         <main class="article-content">
@@ -702,19 +1024,18 @@ class ArticleScraper:
         This is a basic implementation - you might want to use AI services for better summarization
         """
         # Basic summarization - take first few sentences and clean up
-        sentences = content.split('.')
-        
-        # Take first 3-5 sentences that are substantial
         summary_sentences = []
-        for sentence in sentences[:10]:  # Check first 10 sentences
-            sentence = sentence.strip()
+        for match in itertools.islice(_SENTENCE_RE.finditer(content), 10):  # Check first 10 sentences
+            sentence = match.group().strip()
             if len(sentence) > 20:  # Only substantial sentences
                 summary_sentences.append(sentence)
                 if len(summary_sentences) >= 3:
                     break
         
         if summary_sentences:
-            summary = '. '.join(summary_sentences) + '.'
+            summary = ' '.join(summary_sentences)
+            if not summary.endswith(('.', '!', '?')):
+                summary += '.'
             
             # Add a disclaimer
             summary += "\n\n[This is a summarized version of the original article. Read the full article for complete details.]"
@@ -725,19 +1046,13 @@ class ArticleScraper:
         return content[:500] + "..." if len(content) > 500 else content
 
 if __name__ == "__main__":
-    scraper = ArticleScraper()
+    scraper = ArticleScraper(keep_original=True)
     articles = scraper.fetch_articles_from_sitemap()
     if articles:
         url = articles[0]['url']
         url = "https://cineulagam.com/article/pradeep-gift-to-his-helper-video-goes-viral-1760618319"
         article = scraper.scrape_article(url)
-        html_content = scraper.make_html_content(
-            article['title'], 
-            article['original_content'], 
-            article['image_urls'], 
-            article['url'],
-            article.get('tags', [])
-        )
+        html_content = article['html_content']
         # print(html_content)
         with open('article.html', 'w', encoding='utf-8') as f:
             f.write(html_content)
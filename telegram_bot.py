@@ -4,14 +4,81 @@ Telegram Bot integration for posting articles
 Handles posting to Telegram channel with proper formatting
 """
 
+import json
 import logging
 import os
+import random
+import re
+import threading
+import time
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Telegram answers flood-control violations with 429 and a retry_after hint
+MAX_RATE_LIMIT_RETRIES = 8
+MAX_RETRY_DELAY = 60
+# Posts in flight at once, kept well under Telegram's 30 messages/second limit
+POST_CONCURRENCY = 5
+# Local send limits: global API rate, and 20 messages/minute into one chat
+GLOBAL_SEND_RATE = 25.0
+GLOBAL_SEND_BURST = 30
+CHAT_SEND_RATE = 20 / 60
+CHAT_SEND_BURST = 20
+MIN_SEND_RATE = 1.0
+# Consecutive successes before the global rate creeps back up
+RATE_RECOVERY_SUCCESSES = 10
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket; acquire() blocks until a send is allowed
+    The refill rate adapts: halved on a 429, raised again after a run of successes
+    """
+
+    def __init__(self, rate: float = GLOBAL_SEND_RATE, capacity: float = GLOBAL_SEND_BURST):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._successes = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping outside the lock if the bucket is empty"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token for this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+    def record_rate_limited(self):
+        """Halve the refill rate after Telegram reports congestion"""
+        with self._lock:
+            self.rate = max(self.rate * 0.5, MIN_SEND_RATE)
+            self._successes = 0
+        logger.warning(f"Telegram send rate lowered to {self.rate:.1f}/s")
+
+    def record_success(self):
+        """Raise the refill rate toward its ceiling after enough successes"""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= RATE_RECOVERY_SUCCESSES:
+                self._successes = 0
+                self.rate = min(self.rate * 1.1, self.max_rate)
+
 
 class TelegramBot:
     """Handles Telegram Bot API operations for posting articles"""
@@ -21,6 +88,10 @@ class TelegramBot:
         self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN','8204617778:AAE3oY_BvngFe2Ywfa-qz6f78_JPW6HrrM4')
         self.channel_id = os.getenv('TELEGRAM_CHANNEL_ID','@kollywoodmirrors')
         
+        # Worker pool for post_article_async, created on first use
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        
         if not self.bot_token or self.bot_token.strip() == "":
             logger.warning("TELEGRAM_BOT_TOKEN not configured - Telegram posting will be disabled")
             self.bot_token = None
@@ -33,13 +104,60 @@ class TelegramBot:
         
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
         
+        # Persistent session so every API call reuses the same TLS connection
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=0))
+        self.session.headers.update({'Connection': 'keep-alive'})
+        
+        # Pace sends locally so Telegram's own rate limiter rarely has to step in
+        self._bucket_global = TokenBucket(GLOBAL_SEND_RATE, GLOBAL_SEND_BURST)
+        self._bucket_chat = TokenBucket(CHAT_SEND_RATE, CHAT_SEND_BURST)
+        
         # Test bot connection
         self._test_connection()
     
+    def _request_with_backoff(self, method: str, url: str, to_chat: bool = False, **kwargs) -> requests.Response:
+        """
+        Send a request, sleeping and retrying while Telegram responds with 429
+        The wait comes from parameters.retry_after (or the Retry-After header),
+        falling back to exponential backoff, and is capped at MAX_RETRY_DELAY
+        Messages into the channel (to_chat) are also held to the per-chat limit
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES):
+            self._bucket_global.acquire()
+            if to_chat:
+                self._bucket_chat.acquire()
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code != 429:
+                self._bucket_global.record_success()
+                return response
+            
+            self._bucket_global.record_rate_limited()
+            if attempt == MAX_RATE_LIMIT_RETRIES - 1:
+                return response
+            
+            retry_after = None
+            try:
+                retry_after = response.json().get('parameters', {}).get('retry_after')
+            except ValueError:
+                pass
+            if retry_after is None:
+                retry_after = response.headers.get('Retry-After')
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = 2 ** attempt
+            delay = min(delay, MAX_RETRY_DELAY) + random.uniform(0, 0.5)
+            
+            response.close()
+            logger.warning(f"Telegram rate limit hit, retrying in {delay:.1f}s (attempt {attempt + 1}/{MAX_RATE_LIMIT_RETRIES})")
+            time.sleep(delay)
+        return response
+    
     def _test_connection(self):
         """Test bot connection and get bot info"""
         try:
-            response = requests.get(f"{self.base_url}/getMe", timeout=10)
+            response = self._request_with_backoff('GET', f"{self.base_url}/getMe", timeout=10)
             response.raise_for_status()
             
             bot_info = response.json()
@@ -74,17 +192,29 @@ class TelegramBot:
             logger.error(f"Failed to post to Telegram: {str(e)}")
             return False
     
+    def post_article_async(self, title: str, content: str, blogger_url: str, image_url: Optional[str] = None) -> Future:
+        """
+        Schedule post_article on the bot's bounded worker pool
+        Returns a Future resolving to the same result as post_article
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=POST_CONCURRENCY, thread_name_prefix='telegram')
+        return self._executor.submit(self.post_article, title, content, blogger_url, image_url)
+    
     def _format_message(self, title: str, content: str, blogger_url: str) -> str:
         """Format the message for Telegram posting"""
+        if not content:
+            return f"📰 *{title}*\n\n"
+        
         # Create a short snippet from content (first 200 characters)
         snippet = content[:200].strip()
         if len(content) > 200:
             snippet += "..."
         
         # Clean up snippet - remove HTML tags and extra whitespace
-        import re
-        snippet = re.sub(r'<[^>]+>', '', snippet)  # Remove HTML tags
-        snippet = re.sub(r'\s+', ' ', snippet)  # Normalize whitespace
+        snippet = _HTML_TAG_RE.sub('', snippet)  # Remove HTML tags
+        snippet = _WS_RE.sub(' ', snippet)  # Normalize whitespace
         snippet = snippet.strip()
         
         # Format message
@@ -93,6 +223,19 @@ class TelegramBot:
         
         return message
     
+    @staticmethod
+    def _build_reply_markup(blogger_url: str) -> str:
+        """Serialize the inline keyboard holding the "Read More" button"""
+        reply_markup = {
+            'inline_keyboard': [[
+                {
+                    'text': '📖 Read More',
+                    'url': blogger_url
+                }
+            ]]
+        }
+        return json.dumps(reply_markup, separators=(',', ':'), ensure_ascii=False)
+    
     def _send_photo_with_caption(self, image_url: str, caption: str, blogger_url: str = None) -> bool:
         """Send photo with caption to Telegram channel"""
         try:
@@ -108,17 +251,9 @@ class TelegramBot:
             
             # Add inline keyboard with "Read more" button if URL is provided
             if blogger_url:
-                reply_markup = {
-                    'inline_keyboard': [[
-                        {
-                            'text': '📖 Read More',
-                            'url': blogger_url
-                        }
-                    ]]
-                }
-                data['reply_markup'] = str(reply_markup).replace("'", '"')
+                data['reply_markup'] = self._build_reply_markup(blogger_url)
             
-            response = requests.post(url, data=data, timeout=30)
+            response = self._request_with_backoff('POST', url, to_chat=True, data=data, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -158,17 +293,9 @@ class TelegramBot:
             
             # Add inline keyboard with "Read more" button if URL is provided
             if blogger_url:
-                reply_markup = {
-                    'inline_keyboard': [[
-                        {
-                            'text': '📖 Read More',
-                            'url': blogger_url
-                        }
-                    ]]
-                }
-                data['reply_markup'] = str(reply_markup).replace("'", '"')
+                data['reply_markup'] = self._build_reply_markup(blogger_url)
             
-            response = requests.post(url, data=data, timeout=30)
+            response = self._request_with_backoff('POST', url, to_chat=True, data=data, timeout=30)
             response.raise_for_status()
             
             result = response.json()
@@ -208,7 +335,7 @@ class TelegramBot:
             url = f"{self.base_url}/getChat"
             data = {'chat_id': self.channel_id}
             
-            response = requests.post(url, data=data, timeout=10)
+            response = self._request_with_backoff('POST', url, data=data, timeout=10)
             response.raise_for_status()
             
             result = response.json()
